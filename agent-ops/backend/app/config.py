@@ -16,6 +16,8 @@ class Settings(BaseSettings):
     port: int = 8000
     debug: bool = True
     reload: bool = True
+    # Base URL advertised for dynamically deployed workflow endpoints
+    public_base_url: str = "http://localhost:8000"
     
     # CORS Settings
     allowed_origins: list[str] = [
@@ -36,9 +38,13 @@ class Settings(BaseSettings):
     default_neo4j_username: Optional[str] = "neo4j"
     default_neo4j_password: Optional[str] = "password"
     
+    # Provider API keys (highest priority, ahead of stored and frontend keys)
+    groq_api_key: Optional[str] = None
+    
     # Connection Pool Settings
     max_connection_pool_size: int = 50
     connection_acquisition_timeout: int = 10000
+    aura_max_connection_pool_size: int = 5
     
     class Config:
         env_file = ".env"
@@ -133,6 +133,7 @@ class QueryResponse(BaseModel):
     message: str = Field(..., description="Status message")
     data: Optional[Union[List[Dict[str, Any]], GraphData]] = Field(default=None, description="Query result data")
     execution_time_ms: Optional[float] = Field(default=None, description="Query execution time in milliseconds")
+    truncated: bool = Field(default=False, description="Whether rows were dropped to honour max_records")
 
 
 class HealthResponse(BaseModel):
@@ -291,4 +292,5 @@ class CompletionResponse(BaseModel):
     cost: TokenCost = Field(..., description="Cost calculation")
     latency_ms: float = Field(..., description="Request latency in milliseconds")
     request_id: str = Field(..., description="Request ID for tracking")
-    finish_reason: Optional[str] = Field(None, description="Reason why the completion finished")
\ No newline at end of file
+    finish_reason: Optional[str] = Field(None, description="Reason why the completion finished")
+    cache_hit: bool = Field(False, description="Whether the response was served from the completion cache")
\ No newline at end of file
@@ -3,9 +3,13 @@ Service for AI model interactions using stored API keys
 with usage tracking for costs and metrics
 """
 import json
+import hashlib
 import httpx
+import logging
+import orjson
 import time
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, Awaitable
 import asyncio
 from pydantic import BaseModel
 
@@ -16,12 +20,27 @@ from ..models import (
     CompletionRequest, 
     CompletionResponse
 )
+from ..config import settings
 from .api_keys_service import api_keys_service
 from .usage_metrics_service import usage_metrics_service
 from .http_request_tracker import http_tracker
+from .llm_cache import llm_cache
+from .provider_limiter import ProviderLimiter
 
+logger = logging.getLogger(__name__)
 
+# Settings fields holding provider API keys configured through the environment (highest priority)
+SETTINGS_KEY_FIELDS = MappingProxyType({
+    ApiProviderType.GROQ: 'groq_api_key',
+})
 
+# CompletionRequest fields carrying frontend fallback keys (from local storage/context)
+FRONTEND_FALLBACK_KEY_FIELDS = MappingProxyType({
+    ApiProviderType.ANTHROPIC: 'claude4_key',
+    ApiProviderType.GOOGLE: 'gemini_key',
+    ApiProviderType.GROQ: 'groqllama_key',
+    ApiProviderType.VAPI: 'vapi_key',
+})
 
 
 class AIService:
@@ -31,110 +50,144 @@ class AIService:
     """
     def __init__(self):
         """Initialize the AI service"""
-        pass
+        # Deterministic provider calls in flight, keyed by request, so identical concurrent ones share a call
+        self._in_flight: Dict[bytes, "asyncio.Future[CompletionResponse]"] = {}
+        # Concurrency and rate limits, one per provider
+        self._limiters: Dict[ApiProviderType, ProviderLimiter] = {}
+        # Completion call for each supported provider
+        self._providers: Dict[ApiProviderType, Callable[[str, CompletionRequest], Awaitable[CompletionResponse]]] = {
+            ApiProviderType.OPENAI: self._openai_completion,
+            ApiProviderType.ANTHROPIC: self._anthropic_completion,
+            ApiProviderType.GROQ: self._groq_completion,
+            ApiProviderType.GOOGLE: self._google_completion,
+        }
     
     async def get_completion(
         self, 
         provider: ApiProviderType, 
         request: CompletionRequest
     ) -> CompletionResponse:
-        """Get a completion from the specified provider with usage tracking"""
-        # Hardcoded API keys for quick testing (highest priority)
-        HARDCODED_KEYS = {
-            ApiProviderType.GROQ: "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"
-        }
+        """Get a completion from the specified provider with usage tracking
+
+        Deterministic (temperature 0) requests are answered from llm_cache when
+        possible, and identical deterministic requests made while one is already
+        in flight (e.g. sibling workflow nodes fed the same prompt) wait for that
+        call instead of issuing their own. Sampled requests always get their own
+        provider call, so siblings sampling one prompt still get separate samples.
+        """
+        if not llm_cache.is_cacheable(request):
+            return await self._get_completion(provider, request)
         
-        # Frontend fallback keys (from local storage/context) - support different naming
-        FRONTEND_FALLBACK_KEYS = {
-            ApiProviderType.ANTHROPIC: getattr(request, 'claude4_key', None),
-            ApiProviderType.GOOGLE: getattr(request, 'gemini_key', None),
-            ApiProviderType.GROQ: getattr(request, 'groqllama_key', None),
-            ApiProviderType.VAPI: getattr(request, 'vapi_key', None),
-        }
+        cached = llm_cache.get(provider, request)
+        if cached is not None:
+            return cached
+        
+        key = self._request_key(provider, request)
+        call = self._in_flight.get(key)
+        if call is None:
+            call = asyncio.ensure_future(self._get_completion(provider, request))
+            self._in_flight[key] = call
+            call.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        
+        # Shielded so one caller going away doesn't cancel the call for the others
+        response = await asyncio.shield(call)
+        llm_cache.set(provider, request, response)
+        return response.model_copy(deep=True)
+    
+    def _request_key(self, provider: ApiProviderType, request: CompletionRequest) -> bytes:
+        """Digest identifying a completion request to a provider"""
+        payload = orjson.dumps([provider, request.model_dump()], option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    async def _get_completion(
+        self, 
+        provider: ApiProviderType, 
+        request: CompletionRequest
+    ) -> CompletionResponse:
+        """Make one provider call for a completion, recording usage"""
+        provider_call = self._providers.get(provider)
+        if provider_call is None:
+            raise ValueError(f"Unsupported provider: {provider}")
+        
+        fallback_field = FRONTEND_FALLBACK_KEY_FIELDS.get(provider)
+        frontend_key = getattr(request, fallback_field, None) if fallback_field else None
         
         api_key = None
         api_key_source = None
         api_key_id = None
         
-        # 1. Try hardcoded keys first
-        api_key = HARDCODED_KEYS.get(provider)
+        # 1. Try keys configured in settings/env first
+        settings_field = SETTINGS_KEY_FIELDS.get(provider)
+        api_key = getattr(settings, settings_field, None) if settings_field else None
         if api_key:
-            api_key_source = "hardcoded"
-            print(f"[DEBUG] {provider}: Using hardcoded API key")
+            api_key_source = "settings"
         
         # 2. Try backend stored keys
         if not api_key:
             api_key = api_keys_service.get_key_by_provider(provider)
             if api_key:
                 api_key_source = "backend"
-                print(f"[DEBUG] {provider}: Using backend stored API key")
         
         # 3. Try frontend fallback keys
         if not api_key:
-            api_key = FRONTEND_FALLBACK_KEYS.get(provider)
+            api_key = frontend_key
             if api_key:
                 api_key_source = "frontend_fallback"
-                print(f"[DEBUG] {provider}: Using frontend fallback API key")
         
         # 4. Final check
         if not api_key:
-            print(f"[ERROR] {provider}: No API key found in any source!")
-            print(f"  - Hardcoded: {provider in HARDCODED_KEYS}")
-            print(f"  - Backend: {api_keys_service.get_key_by_provider(provider) is not None}")
-            print(f"  - Frontend: {FRONTEND_FALLBACK_KEYS.get(provider) is not None}")
+            logger.error("%s: No API key found (checked settings, backend and frontend fallback keys)", provider)
             raise ValueError(f"No valid API key found for {provider}")
         
         # Log what we're using (safely)
-        masked_key = api_key[:8] + "..." + api_key[-4:] if len(api_key) > 12 else "***"
-        print(f"[DEBUG] {provider}: Using {api_key_source} key ({masked_key})")
+        if logger.isEnabledFor(logging.DEBUG):
+            masked_key = api_key[:8] + "..." + api_key[-4:] if len(api_key) > 12 else "***"
+            logger.debug("%s: Using %s key (%s)", provider, api_key_source, masked_key)
+        
+        limiter = self._limiters.get(provider)
+        if limiter is None:
+            limiter = self._limiters[provider] = ProviderLimiter()
         
-        # Start timing the request
-        start_time = time.time()
+        # Wait for a slot with the provider before the request is timed
+        async with limiter.slot():
+            # Start timing the request
+            start_time = time.time()
         
-        try:
-            # Call the appropriate provider
-            if provider == ApiProviderType.OPENAI:
-                response = await self._openai_completion(api_key, request)
-            elif provider == ApiProviderType.ANTHROPIC:
-                response = await self._anthropic_completion(api_key, request)
-            elif provider == ApiProviderType.GROQ:
-                response = await self._groq_completion(api_key, request)
-            elif provider == ApiProviderType.GOOGLE:
-                response = await self._google_completion(api_key, request)
-            else:
-                raise ValueError(f"Unsupported provider: {provider}")
+            try:
+                # Call the appropriate provider
+                response = await provider_call(api_key, request)
             
-            # Calculate latency
-            latency_ms = (time.time() - start_time) * 1000
+                # Calculate latency
+                latency_ms = (time.time() - start_time) * 1000
             
-            # Create token usage object
-            token_usage = TokenUsage(
-                prompt_tokens=response.usage.prompt_tokens,
-                completion_tokens=response.usage.completion_tokens,
-                total_tokens=response.usage.total_tokens
-            )
+                # Create token usage object
+                token_usage = TokenUsage(
+                    prompt_tokens=response.usage.prompt_tokens,
+                    completion_tokens=response.usage.completion_tokens,
+                    total_tokens=response.usage.total_tokens
+                )
             
-            # Record usage metrics
-            metrics = usage_metrics_service.record_usage(
-                provider=provider,
-                model=response.model,
-                usage=token_usage,
-                latency_ms=latency_ms,
-                api_key_id=api_key_id
-            )
+                # Record usage metrics
+                metrics = usage_metrics_service.record_usage(
+                    provider=provider,
+                    model=response.model,
+                    usage=token_usage,
+                    latency_ms=latency_ms,
+                    api_key_id=api_key_id
+                )
             
-            # Update response with cost and latency information
-            response.cost = metrics.cost
-            response.latency_ms = metrics.latency_ms
-            response.request_id = metrics.request_id
+                # Update response with cost and latency information
+                response.cost = metrics.cost
+                response.latency_ms = metrics.latency_ms
+                response.request_id = metrics.request_id
             
-            return response
+                return response
             
-        except Exception as e:
-            # Record the end time even for failed requests
-            latency_ms = (time.time() - start_time) * 1000
-            # Re-raise the exception
-            raise e
+            except Exception as e:
+                # Record the end time even for failed requests
+                latency_ms = (time.time() - start_time) * 1000
+                # Re-raise the exception
+                raise e
     
     async def _openai_completion(
         self, 
@@ -203,6 +256,7 @@ class AIService:
         
         # Convert messages to Anthropic format
         messages = []
+        system_content = None
         for msg in request.messages:
             if msg["role"] == "system":
                 # Anthropic handles system messages differently
@@ -223,7 +277,7 @@ class AIService:
         }
         
         # Add system message if present
-        if "system_content" in locals():
+        if system_content is not None:
             payload["system"] = system_content
         
         # Track the HTTP request
@@ -265,13 +319,10 @@ class AIService:
         request: CompletionRequest
     ) -> CompletionResponse:
         """Get a completion from Groq with enhanced logging"""
-        print(f"\n🤖 GROQ API CALL STARTING")
-        print(f"   📋 Model: {request.model}")
-        print(f"   🌡️  Temperature: {request.temperature}")
-        print(f"   📏 Max Tokens: {request.max_tokens}")
-        print(f"   💬 Messages Count: {len(request.messages)}")
-        for i, msg in enumerate(request.messages):
-            print(f"   💬 Message {i+1} ({msg['role']}): {msg['content'][:100]}...")
+        logger.debug(
+            "Groq call: model %s, temperature %s, max_tokens %s, %d messages",
+            request.model, request.temperature, request.max_tokens, len(request.messages)
+        )
         
         headers = {
             "Authorization": f"Bearer {api_key}",
@@ -286,10 +337,6 @@ class AIService:
             "max_tokens": request.max_tokens
         }
         
-        print(f"   📤 Sending request to Groq API...")
-        print(f"   📤 URL: https://api.groq.com/openai/v1/chat/completions")
-        print(f"   📤 Payload keys: {list(payload.keys())}")
-        
         # Track the HTTP request
         async with http_tracker.track_httpx_request(
             "POST",
@@ -299,25 +346,15 @@ class AIService:
             timeout=60.0
         ) as response:
             
-            print(f"   📥 Groq API response received")
-            print(f"   📥 Status Code: {response.status_code}")
-            
             if response.status_code != 200:
-                error_text = response.text
-                print(f"   ❌ Groq API Error: {error_text}")
-                raise ValueError(f"Groq API error: {error_text}")
+                raise ValueError(f"Groq API error: {response.text}")
             
             data = response.json()
-            print(f"   ✅ Groq API response parsed successfully")
             
             # Extract response data
             content = data["choices"][0]["message"]["content"]
             usage_data = data["usage"]
             
-            print(f"   📊 Content Length: {len(content)} characters")
-            print(f"   📊 Token Usage: {usage_data}")
-            print(f"   📊 Content Preview: {content[:150]}...")
-            
             groq_response = CompletionResponse(
                 content=content,
                 model=data["model"],
@@ -336,11 +373,10 @@ class AIService:
                 request_id="",  # Will be filled in by get_completion
                 finish_reason=data["choices"][0]["finish_reason"]
             )
-            
-            print(f"   🎉 Groq CompletionResponse object created successfully")
-            print(f"   🎉 Provider: {groq_response.provider}")
-            print(f"   🎉 Finish Reason: {groq_response.finish_reason}")
-            print(f"   🎉 Total Tokens: {groq_response.usage.total_tokens}")
+            logger.debug(
+                "Groq response: %d chars, finish reason %s, usage %s",
+                len(content), groq_response.finish_reason, usage_data
+            )
             
             return groq_response
     
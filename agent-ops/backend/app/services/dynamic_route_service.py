@@ -3,16 +3,93 @@ Dynamic Route Generation Service
 Creates live FastAPI endpoints from workflow nodes
 """
 import uuid
-from typing import Dict, List, Any, Callable, Optional, AsyncGenerator
+from types import MappingProxyType
+from typing import Dict, List, Any, Callable, Mapping, Optional, AsyncGenerator, Awaitable, Tuple
 from fastapi import FastAPI, APIRouter, Request, HTTPException
-from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-import json
+from fastapi.responses import Response, StreamingResponse, ORJSONResponse
+from pydantic import BaseModel, Field
+import orjson
 import asyncio
+import hashlib
+import logging
+import reprlib
+import time
+from collections import OrderedDict, defaultdict
+from contextvars import ContextVar
 from datetime import datetime
 
-from ..models.workflow_models import WorkflowNode, NodeType
+from ..models.workflow_models import WorkflowNode, NodeType, ExecutionStatus, NodeExecutionResult
 from ..models.deployment_models import EndpointInfo
+from ..config import settings
+from .execution.base_executor import ExecutionContext
+from .execution.executor_factory import ExecutorFactory
+
+logger = logging.getLogger(__name__)
+
+# Bounded repr for log and progress previews: stops walking a large payload
+# early instead of stringifying all of it and then slicing
+_PREVIEW = reprlib.Repr()
+_PREVIEW.maxstring = 200
+_PREVIEW.maxother = 200
+_PREVIEW.maxdict = 6
+_PREVIEW.maxlist = 6
+
+# Workflow-level context of the run the current node task belongs to
+_current_run: ContextVar[ExecutionContext] = ContextVar('current_run')
+
+# Node types served by an AI completion endpoint
+_AI_NODE_TYPES = frozenset({NodeType.GROQLLAMA, NodeType.CLAUDE4, NodeType.GEMINI, NodeType.CHATBOT})
+
+# Node types whose configuration can be customized through the API
+_CONFIGURABLE_NODE_TYPES = frozenset({'groqllama', 'claude4', 'gemini', 'chatbot', 'graphrag'})
+
+# Fields every custom AI node configuration must provide
+_REQUIRED_AI_CONFIG_FIELDS = frozenset({'model', 'temperature', 'max_tokens', 'system_prompt', 'user_prompt'})
+
+# AI node default configurations, built once and shared read-only
+_AI_DEFAULT_CONFIGS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'groqllama': MappingProxyType({
+        "model": "llama3-70b-8192",
+        "temperature": 0.7,
+        "max_tokens": 1000,
+        "system_prompt": "You are a helpful AI assistant that processes information.",
+        "user_prompt": "Please analyze and respond to the following:"
+    }),
+    'claude4': MappingProxyType({
+        "model": "claude-3-haiku-20240307",
+        "temperature": 0.7,
+        "max_tokens": 1000,
+        "system_prompt": "You are Claude, a helpful AI assistant.",
+        "user_prompt": "Please provide a thoughtful response to:"
+    }),
+    'gemini': MappingProxyType({
+        "model": "gemini-1.5-flash",
+        "temperature": 0.7,
+        "max_tokens": 1000,
+        "system_prompt": "You are Gemini, a helpful AI assistant.",
+        "user_prompt": "Please analyze and respond to:"
+    }),
+    'chatbot': MappingProxyType({
+        "model": "gpt-4o",
+        "temperature": 0.7,
+        "max_tokens": 1000,
+        "system_prompt": "You are a helpful AI chatbot.",
+        "user_prompt": "Please respond to:"
+    }),
+})
+
+# GraphRAG default configuration
+_GRAPHRAG_DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType({
+    "operation": "query",
+    "extract_entities": True,
+    "extract_relationships": True,
+    "max_results": 10
+})
+
+
+class ErrorResult(dict):
+    """Error info standing in for a failed node's result, recognisable by type"""
+    __slots__ = ()
 
 
 class NodeExecutionRequest(BaseModel):
@@ -30,20 +107,91 @@ class NodeExecutionResponse(BaseModel):
     output_data: Optional[Any] = None
     execution_time_ms: Optional[float] = None
     message: str = ""
-    timestamp: datetime = datetime.now()
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # default_factory so each response gets its own time, not the import time
+    timestamp: datetime = Field(default_factory=datetime.now)
+
+
+def _type_str(node_type: Any) -> str:
+    """Plain string for a node type, whether it is a NodeType enum or already a str"""
+    value = getattr(node_type, 'value', None)
+    return value if value is not None else str(node_type)
+
+
+def _builtin_default_config(node_type_str: str) -> Mapping[str, Any]:
+    """Built-in default configuration for a node type (empty if it has none)"""
+    if node_type_str == 'graphrag':
+        return _GRAPHRAG_DEFAULT_CONFIG
+    return _AI_DEFAULT_CONFIGS.get(node_type_str, {})
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Fallback for values orjson cannot serialize natively (e.g. NodeExecutionResult)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    return str(obj)
+
+
+def _memo_key_default(obj: Any) -> Any:
+    """orjson fallback for memo keys: unlike _orjson_default, never falls back to str(),
+    since different values with the same str() would share a cache entry"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not memoizable: {type(obj).__name__}")
+
+
+def _unwrap_result(output: Any) -> Any:
+    """Actual output data of a NodeExecutionResult, anything else as-is"""
+    return output.output_data if isinstance(output, NodeExecutionResult) else output
+
+
+def _node_output_default(obj: Any) -> Any:
+    """orjson fallback for node outputs: unwrap NodeExecutionResult to its output_data"""
+    if isinstance(obj, NodeExecutionResult):
+        return obj.output_data
+    return _orjson_default(obj)
+
+
+class NodeJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also serializes Pydantic models nested in node outputs"""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _static_etag(body: bytes) -> str:
+    """Strong ETag for a pre-rendered response body"""
+    return '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against our ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _sse_frame(payload: Any) -> bytes:
+    """Encode one server-sent event frame; node results inside are reduced to their output data"""
+    return b"data: " + orjson.dumps(payload, default=_node_output_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) + b"\n\n"
 
 
 class DynamicRouteService:
     """Service for generating and registering dynamic FastAPI routes"""
     
-    def __init__(self, app: FastAPI):
+    def __init__(self, app: FastAPI, max_concurrent_nodes: int = 8, memo_max_entries: int = 256):
         self.app = app
+        # Base for the absolute URLs reported in EndpointInfo, resolved once
+        self._base_url = settings.public_base_url.rstrip('/')
+        # Upper bound on independent nodes executed at once (protects provider rate limits)
+        self.max_concurrent_nodes = max_concurrent_nodes
         self.registered_routes: Dict[str, Dict[str, Any]] = {}
+        # LRU of results from deterministic node executions, keyed by _memo_key
+        self._memo: "OrderedDict[bytes, Any]" = OrderedDict()
+        self.memo_max_entries = memo_max_entries
+        # Pre-rendered status body and cache headers per (deployment_id, node_id)
+        self._status_bodies: Dict[Tuple[str, str], Tuple[bytes, Dict[str, str]]] = {}
         # Storage for custom AI configurations
         self.custom_ai_configs: Dict[str, Dict[str, Any]] = {}
         
@@ -55,124 +203,134 @@ class DynamicRouteService:
     ) -> List[EndpointInfo]:
         """Generate and register live FastAPI routes from workflow nodes"""
         
-        print(f"🔧 Generating routes for deployment: {deployment_id}")
-        print(f"   📊 Nodes: {len(workflow_nodes)}, Edges: {len(workflow_edges)}")
+        deployment_prefix = f"/api/deployed/{deployment_id}"
         
-        # Create a router for this deployment
+        # Create a router for this deployment's workflow-level endpoints
         deployment_router = APIRouter(
-            prefix=f"/api/deployed/{deployment_id}",
+            prefix=deployment_prefix,
             tags=[f"Deployed Workflow - {deployment_id}"]
         )
         
-        # ALSO create a direct router for easier access (no prefix)
-        direct_router = APIRouter(
-            prefix="",  # No prefix for direct access
-            tags=[f"Direct Access - {deployment_id}"]
-        )
+        # Node endpoints are created once and mounted under both the deployment
+        # prefix and the root (direct access without prefix)
+        node_router = APIRouter()
         
         endpoints = []
         
         for node in workflow_nodes:
-            # Create endpoints for deployment router
-            node_endpoints_deployment = self._create_node_endpoints(node, deployment_router, f"/api/deployed/{deployment_id}")
-            endpoints.extend(node_endpoints_deployment)
-            
-            # Create endpoints for direct router (easier access)
-            node_endpoints_direct = self._create_node_endpoints(node, direct_router, "")
-            endpoints.extend(node_endpoints_direct)
+            node_endpoints = self._create_node_endpoints(node, node_router, [deployment_prefix, ""], deployment_id)
+            endpoints.extend(node_endpoints)
         
         # Add workflow-level endpoints (including the new execute endpoint)
         workflow_endpoints = self._create_workflow_endpoints(workflow_nodes, deployment_router, deployment_id)
         endpoints.extend(workflow_endpoints)
         
-        # Register both routers with the main app
+        # Register the routers with the main app
         self.app.include_router(deployment_router)
-        self.app.include_router(direct_router)
+        self.app.include_router(node_router, prefix=deployment_prefix, tags=[f"Deployed Workflow - {deployment_id}"])
+        self.app.include_router(node_router, tags=[f"Direct Access - {deployment_id}"])
         
         # Store registration info INCLUDING EDGES
         self.registered_routes[deployment_id] = {
             'router': deployment_router,
-            'direct_router': direct_router,
+            'node_router': node_router,
             'endpoints': endpoints,
             'nodes': workflow_nodes,
             'edges': workflow_edges,
+            'edges_norm': self._normalize_edges(workflow_edges),
             'created_at': datetime.now()
         }
         
-        print(f"✅ Registered {len(endpoints)} live endpoints for deployment {deployment_id}")
-        print(f"   📍 Direct access URLs:")
+        # The graph is fixed for the lifetime of a deployment, so build it once here
+        # instead of on every execute request
+        self.registered_routes[deployment_id]['execution_graph'] = self._build_execution_graph(workflow_nodes, deployment_id)
+        
+        # Build the whole summary first and log it once
+        lines = [
+            f"🔧 Generated routes for deployment: {deployment_id}",
+            f"   📊 Nodes: {len(workflow_nodes)}, Edges: {len(workflow_edges)}",
+            f"✅ Registered {len(endpoints)} live endpoints for deployment {deployment_id}",
+            "   📍 Direct access URLs:"
+        ]
         for node in workflow_nodes:
-            print(f"      • GET  /nodes/{node.id}/status")
-            if node.type in [NodeType.GROQLLAMA, NodeType.CLAUDE4, NodeType.GEMINI, NodeType.CHATBOT]:
-                print(f"      • POST /nodes/{node.id}/completion")
+            lines.append(f"      • GET  /nodes/{node.id}/status")
+            if node.type in _AI_NODE_TYPES:
+                lines.append(f"      • POST /nodes/{node.id}/completion")
             elif node.type == NodeType.GRAPHRAG:
-                print(f"      • POST /nodes/{node.id}/query")
-        print(f"   📍 Deployment access: /api/deployed/{deployment_id}/nodes/{{node_id}}/...")
-        print(f"   🔗 Workflow execution: POST /api/deployed/{deployment_id}/execute")
+                lines.append(f"      • POST /nodes/{node.id}/query")
+        lines.append(f"   📍 Deployment access: /api/deployed/{deployment_id}/nodes/{{node_id}}/...")
+        lines.append(f"   🔗 Workflow execution: POST /api/deployed/{deployment_id}/execute")
+        logger.info("\n".join(lines))
         
         return endpoints
     
-    def _create_node_endpoints(self, node: WorkflowNode, router: APIRouter, url_prefix: str) -> List[EndpointInfo]:
-        """Create specific endpoints for a workflow node"""
-        endpoints = []
+    def _create_node_endpoints(
+        self, node: WorkflowNode, router: APIRouter, url_prefixes: List[str], deployment_id: str
+    ) -> List[EndpointInfo]:
+        """Create specific endpoints for a workflow node, described once per mount prefix"""
+        routes = []  # (method, path, description) relative to the router
         node_path = f"/nodes/{node.id}"
+        status_path = f"{node_path}/status"
+        node_label = node.data.get('label', node.type)
         
-        if node.type in [NodeType.GROQLLAMA, NodeType.CLAUDE4, NodeType.GEMINI, NodeType.CHATBOT]:
+        if node.type in _AI_NODE_TYPES:
             # AI completion endpoint
+            completion_path = f"{node_path}/completion"
             completion_handler = self._create_ai_completion_handler(node)
             router.post(
-                f"{node_path}/completion",
-                response_model=NodeExecutionResponse,
-                summary=f"Generate completion using {node.data.get('label', node.type)}"
+                completion_path,
+                response_class=NodeJSONResponse,
+                responses={200: {"model": NodeExecutionResponse}},
+                summary=f"Generate completion using {node_label}"
             )(completion_handler)
             
-            endpoints.append(EndpointInfo(
-                method="POST",
-                path=f"{url_prefix}{node_path}/completion",
-                description=f"Generate AI completion using {node.data.get('label', node.type)}",
-                url=f"http://localhost:8000{url_prefix}{node_path}/completion"
-            ))
+            routes.append(("POST", completion_path, f"Generate AI completion using {node_label}"))
         
         elif node.type == NodeType.GRAPHRAG:
             # GraphRAG query endpoint
+            query_path = f"{node_path}/query"
             query_handler = self._create_graphrag_query_handler(node)
             router.post(
-                f"{node_path}/query",
-                response_model=NodeExecutionResponse,
-                summary=f"Query GraphRAG using {node.data.get('label', node.type)}"
+                query_path,
+                response_class=NodeJSONResponse,
+                responses={200: {"model": NodeExecutionResponse}},
+                summary=f"Query GraphRAG using {node_label}"
             )(query_handler)
             
-            endpoints.append(EndpointInfo(
-                method="POST",
-                path=f"{url_prefix}{node_path}/query",
-                description=f"Query GraphRAG using {node.data.get('label', node.type)}",
-                url=f"http://localhost:8000{url_prefix}{node_path}/query"
-            ))
+            routes.append(("POST", query_path, f"Query GraphRAG using {node_label}"))
         
         # Add status endpoint for all nodes
-        status_handler = self._create_status_handler(node)
+        status_handler = self._create_status_handler(node, deployment_id)
         router.get(
-            f"{node_path}/status",
-            summary=f"Get status of {node.data.get('label', node.type)}"
+            status_path,
+            response_class=Response,
+            summary=f"Get status of {node_label}"
         )(status_handler)
         
-        endpoints.append(EndpointInfo(
-            method="GET",
-            path=f"{url_prefix}{node_path}/status",
-            description=f"Get status of {node.data.get('label', node.type)}",
-            url=f"http://localhost:8000{url_prefix}{node_path}/status"
-        ))
+        routes.append(("GET", status_path, f"Get status of {node_label}"))
         
+        endpoints = []
+        for url_prefix in url_prefixes:
+            base_url = f"{self._base_url}{url_prefix}"
+            for method, path, description in routes:
+                endpoints.append(EndpointInfo(
+                    method=method,
+                    path=url_prefix + path,
+                    description=description,
+                    url=base_url + path
+                ))
         return endpoints
     
     def _create_workflow_endpoints(self, nodes: List[WorkflowNode], router: APIRouter, deployment_id: str) -> List[EndpointInfo]:
         """Create workflow-level endpoints"""
         endpoints = []
+        deployment_url = f"{self._base_url}/api/deployed/{deployment_id}"
         
         # Health check endpoint
         health_handler = self._create_deployment_health_handler(deployment_id)
         router.get(
             "/health",
+            response_class=Response,
             summary="Health check for this deployment"
         )(health_handler)
         
@@ -180,14 +338,14 @@ class DynamicRouteService:
             method="GET",
             path="/health", 
             description="Check if deployment is healthy and responsive",
-            url=f"http://localhost:8000/api/deployed/{deployment_id}/health"
+            url=f"{deployment_url}/health"
         ))
         
         # NEW: Workflow execution endpoint
         workflow_execute_handler = self._create_workflow_execute_handler(deployment_id)
         router.post(
             "/execute",
-            response_model=Dict[str, Any],
+            response_class=NodeJSONResponse,
             summary="Execute the entire workflow with automatic node chaining"
         )(workflow_execute_handler)
         
@@ -202,150 +360,167 @@ class DynamicRouteService:
             method="POST",
             path="/execute",
             description="Execute the entire workflow with automatic data flow between nodes",
-            url=f"http://localhost:8000/api/deployed/{deployment_id}/execute"
+            url=f"{deployment_url}/execute"
         ))
         
         endpoints.append(EndpointInfo(
             method="POST",
             path="/execute-stream",
             description="Execute workflow with real-time progress streaming",
-            url=f"http://localhost:8000/api/deployed/{deployment_id}/execute-stream"
+            url=f"{deployment_url}/execute-stream"
         ))
         
         return endpoints
     
     def _create_ai_completion_handler(self, node: WorkflowNode) -> Callable:
         """Create handler for AI completion endpoints using real executors"""
+        # Resolve everything that does not change between requests once, at registration
+        executor = ExecutorFactory.get_executor(node.type)
+        node_id = node.id
+        node_type_str = _type_str(node.type)
+        node_label = node.data.get('label', node_type_str)
+        success_message = f"Successfully executed {node_label}"
+        
         async def handler(request: NodeExecutionRequest):
-            import time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             try:
-                # Use real executor factory to get the appropriate executor
-                from .execution.executor_factory import ExecutorFactory
-                
-                # Get the executor for this node type
-                executor = ExecutorFactory.get_executor(node.type)
-                
                 # Create execution context
-                from .execution.base_executor import ExecutionContext
-                execution_id = f"ai_{node.id}_{int(time.time() * 1000)}"
-                context = ExecutionContext(execution_id=execution_id, debug=True)
+                execution_id = f"ai_{node_id}_{uuid.uuid4().hex[:8]}"
+                context = ExecutionContext(execution_id=execution_id, debug=request.debug)
                 
                 # Execute the node with real logic
                 result = await executor.execute(node, context, request.input_data)
                 
-                execution_time = (time.time() - start_time) * 1000
+                execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
-                # Handle both NodeType enum and string types
-                node_type_str = node.type.value if hasattr(node.type, 'value') else str(node.type)
-                
-                return NodeExecutionResponse(
-                    success=True,
-                    node_id=node.id,
-                    node_type=node_type_str,
-                    output_data=result,
-                    execution_time_ms=execution_time,
-                    message=f"Successfully executed {node.data.get('label', node.type)}"
-                )
+                return NodeJSONResponse({
+                    "success": True,
+                    "node_id": node_id,
+                    "node_type": node_type_str,
+                    "output_data": result,
+                    "execution_time_ms": execution_time,
+                    "message": success_message,
+                    "timestamp": datetime.now()
+                })
                 
             except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
-                node_type_str = node.type.value if hasattr(node.type, 'value') else str(node.type)
+                execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
-                return NodeExecutionResponse(
-                    success=False,
-                    node_id=node.id,
-                    node_type=node_type_str,
-                    execution_time_ms=execution_time,
-                    message=f"Execution failed: {str(e)}"
-                )
+                return NodeJSONResponse({
+                    "success": False,
+                    "node_id": node_id,
+                    "node_type": node_type_str,
+                    "output_data": None,
+                    "execution_time_ms": execution_time,
+                    "message": f"Execution failed: {str(e)}",
+                    "timestamp": datetime.now()
+                })
         
         return handler
     
     def _create_graphrag_query_handler(self, node: WorkflowNode) -> Callable:
         """Create handler for GraphRAG query endpoints"""
+        # Resolve everything that does not change between requests once, at registration
+        executor = ExecutorFactory.get_executor(node.type)
+        node_id = node.id
+        node_type_str = _type_str(node.type)
+        node_label = node.data.get('label', node_type_str)
+        success_message = f"Successfully executed GraphRAG query using {node_label}"
+        
         async def handler(request: NodeExecutionRequest):
-            import time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             try:
-                # Use real executor factory to get the GraphRAG executor
-                from .execution.executor_factory import ExecutorFactory
-                
-                # Get the executor for this node type
-                executor = ExecutorFactory.get_executor(node.type)
-                
                 # Create execution context
-                from .execution.base_executor import ExecutionContext
-                execution_id = f"graphrag_{node.id}_{int(time.time() * 1000)}"
-                context = ExecutionContext(execution_id=execution_id, debug=True)
+                execution_id = f"graphrag_{node_id}_{uuid.uuid4().hex[:8]}"
+                context = ExecutionContext(execution_id=execution_id, debug=request.debug)
                 
                 # Execute the node with real logic
                 result = await executor.execute(node, context, request.input_data)
                 
-                execution_time = (time.time() - start_time) * 1000
-                
-                # Handle both NodeType enum and string types
-                node_type_str = node.type.value if hasattr(node.type, 'value') else str(node.type)
+                execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
-                return NodeExecutionResponse(
-                    success=True,
-                    node_id=node.id,
-                    node_type=node_type_str,
-                    output_data=result,
-                    execution_time_ms=execution_time,
-                    message=f"Successfully executed GraphRAG query using {node.data.get('label', node.type)}"
-                )
+                return NodeJSONResponse({
+                    "success": True,
+                    "node_id": node_id,
+                    "node_type": node_type_str,
+                    "output_data": result,
+                    "execution_time_ms": execution_time,
+                    "message": success_message,
+                    "timestamp": datetime.now()
+                })
                 
             except Exception as e:
-                execution_time = (time.time() - start_time) * 1000
-                node_type_str = node.type.value if hasattr(node.type, 'value') else str(node.type)
+                execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
                 
-                return NodeExecutionResponse(
-                    success=False,
-                    node_id=node.id,
-                    node_type=node_type_str,
-                    execution_time_ms=execution_time,
-                    message=f"GraphRAG query failed: {str(e)}"
-                )
+                return NodeJSONResponse({
+                    "success": False,
+                    "node_id": node_id,
+                    "node_type": node_type_str,
+                    "output_data": None,
+                    "execution_time_ms": execution_time,
+                    "message": f"GraphRAG query failed: {str(e)}",
+                    "timestamp": datetime.now()
+                })
         
         return handler
     
-    def _create_status_handler(self, node: WorkflowNode) -> Callable:
+    def _create_status_handler(self, node: WorkflowNode, deployment_id: str) -> Callable:
         """Create handler for node status endpoints"""
-        async def handler():
-            # Handle both NodeType enum and string types
-            node_type_str = node.type.value if hasattr(node.type, 'value') else str(node.type)
-            
-            return {
-                "node_id": node.id,
-                "node_type": node_type_str,
-                "label": node.data.get('label', 'Unknown'),
-                "description": node.data.get('description', ''),
-                "status": "healthy",
-                "config": node.config,
-                "position": node.position,
-                "timestamp": datetime.now().isoformat()
-            }
+        key = (deployment_id, node.id)
+        self._render_status_body(key, node)
+        
+        async def handler(request: Request):
+            # Re-rendered by _render_status_body whenever the node's config changes
+            static_body, cache_headers = self._status_bodies[key]
+            if _etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+                return Response(status_code=304, headers=cache_headers)
+            return Response(
+                content=static_body + b',"timestamp":"' + datetime.now().isoformat().encode() + b'"}',
+                media_type="application/json",
+                headers=cache_headers
+            )
         
         return handler
     
+    def _render_status_body(self, key: Tuple[str, str], node: WorkflowNode) -> None:
+        """Pre-render a node's status body and ETag for its status handler"""
+        # Everything except the timestamp is static, so render it once and leave
+        # the object open (trailing "}" stripped) for the per-request timestamp
+        static_body = orjson.dumps({
+            "node_id": node.id,
+            "node_type": _type_str(node.type),
+            "label": node.data.get('label', 'Unknown'),
+            "description": node.data.get('description', ''),
+            "status": "healthy",
+            "config": node.config,
+            "position": node.position
+        }, default=_orjson_default)[:-1]
+        # Only the timestamp varies, so the static part (config included) identifies the representation;
+        # no-cache makes clients revalidate with it on every poll instead of reusing a stale config
+        self._status_bodies[key] = (static_body, {"ETag": _static_etag(static_body), "Cache-Control": "no-cache"})
+    
     def _create_deployment_health_handler(self, deployment_id: str) -> Callable:
         """Create health check handler for deployment"""
-        async def handler():
-            return {
-                "status": "healthy",
-                "deployment_id": deployment_id,
-                "message": "Deployment is running and accessible"
-            }
+        body = orjson.dumps({
+            "status": "healthy",
+            "deployment_id": deployment_id,
+            "message": "Deployment is running and accessible"
+        })
+        etag = _static_etag(body)
+        cache_headers = {"ETag": etag, "Cache-Control": "no-cache"}
+        
+        async def handler(request: Request):
+            if _etag_matches(request.headers.get("if-none-match"), etag):
+                return Response(status_code=304, headers=cache_headers)
+            return Response(content=body, media_type="application/json", headers=cache_headers)
         return handler
     
     def _create_workflow_execute_handler(self, deployment_id: str) -> Callable:
         """Create handler for executing entire workflow with automatic node chaining"""
         async def handler(request: NodeExecutionRequest):
-            import time
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             
             # Get deployment info
             deployment_info = self.registered_routes.get(deployment_id)
@@ -354,29 +529,30 @@ class DynamicRouteService:
             
             nodes = deployment_info['nodes']
             
-            print(f"\n🚀 WORKFLOW EXECUTION STARTED - Deployment: {deployment_id}")
-            print(f"📊 Total nodes in workflow: {len(nodes)}")
-            print(f"💾 Initial input data: {request.input_data}")
-            print(f"⚙️  Parameters: {request.parameters}")
-            print("=" * 80)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Workflow execution started - deployment %s, %d nodes", deployment_id, len(nodes))
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Initial input: %s, parameters: %s", _PREVIEW.repr(request.input_data), _PREVIEW.repr(request.parameters))
             
-            # Build execution graph from edges (stored during registration)
-            execution_graph = self._build_execution_graph(nodes, deployment_id)
+            # Execution graph is built from the edges during registration
+            execution_graph = deployment_info['execution_graph']
             
             # Execute workflow with node chaining
             workflow_result = await self._execute_workflow_chain(
                 execution_graph, 
                 request.input_data, 
                 request.parameters,
-                deployment_id
+                deployment_id,
+                debug=request.debug
             )
             
-            execution_time = (time.time() - start_time) * 1000
+            execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             
-            print(f"\n✅ WORKFLOW EXECUTION COMPLETED")
-            print(f"⏱️  Total execution time: {execution_time:.2f}ms")
-            print(f"📤 Final output type: {type(workflow_result.get('final_output', 'None')).__name__}")
-            print("=" * 80)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Workflow execution completed - deployment %s in %.2fms, final output type %s",
+                    deployment_id, execution_time, type(workflow_result.get('final_output')).__name__
+                )
             
             # Process final output for better display
             final_output = workflow_result.get('final_output')
@@ -385,7 +561,7 @@ class DynamicRouteService:
             else:
                 processed_final_output = final_output
             
-            return {
+            return NodeJSONResponse({
                 "success": True,
                 "deployment_id": deployment_id,
                 "execution_time_ms": execution_time,
@@ -394,44 +570,45 @@ class DynamicRouteService:
                 "final_output": processed_final_output,
                 "node_outputs": workflow_result.get('node_outputs', {}),
                 "message": f"Workflow executed successfully with {len(workflow_result.get('nodes_executed', []))} nodes"
-            }
+            })
         
         return handler
     
     def _create_workflow_stream_handler(self, deployment_id: str) -> Callable:
         """Create handler for streaming workflow execution with real-time progress"""
         async def handler(request: NodeExecutionRequest):
-            async def generate_progress() -> AsyncGenerator[str, None]:
+            async def generate_progress() -> AsyncGenerator[bytes, None]:
                 try:
                     # Get deployment info
                     deployment_info = self.registered_routes.get(deployment_id)
                     if not deployment_info:
-                        yield f"data: {json.dumps({'error': f'Deployment {deployment_id} not found'})}\n\n"
+                        yield _sse_frame({'error': f'Deployment {deployment_id} not found'})
                         return
 
                     nodes = deployment_info['nodes']
                     
                     # Send initial status
-                    yield f"data: {json.dumps({'type': 'start', 'deployment_id': deployment_id, 'total_nodes': len(nodes)})}\n\n"
+                    yield _sse_frame({'type': 'start', 'deployment_id': deployment_id, 'total_nodes': len(nodes)})
                     
-                    # Build execution graph
-                    yield f"data: {json.dumps({'type': 'building_graph', 'message': 'Building execution graph...'})}\n\n"
-                    execution_graph = self._build_execution_graph(nodes, deployment_id)
+                    # Execution graph is built from the edges during registration
+                    yield _sse_frame({'type': 'building_graph', 'message': 'Building execution graph...'})
+                    execution_graph = deployment_info['execution_graph']
                     
                     # Send graph info
-                    yield f"data: {json.dumps({'type': 'graph_built', 'start_nodes': execution_graph['start_nodes'], 'dependencies': execution_graph['dependencies']})}\n\n"
+                    yield _sse_frame({'type': 'graph_built', 'start_nodes': execution_graph['start_nodes'], 'dependencies': execution_graph['dependencies']})
                     
                     # Execute workflow with streaming updates
                     async for update in self._execute_workflow_chain_streaming(
                         execution_graph, 
                         request.input_data, 
                         request.parameters,
-                        deployment_id
+                        deployment_id,
+                        debug=request.debug
                     ):
-                        yield f"data: {json.dumps(update)}\n\n"
+                        yield _sse_frame(update)
                         
                 except Exception as e:
-                    yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+                    yield _sse_frame({'type': 'error', 'message': str(e)})
             
             return StreamingResponse(
                 generate_progress(),
@@ -446,41 +623,60 @@ class DynamicRouteService:
         
         return handler
     
+    def _normalize_edges(self, edges: List[Any]) -> List[Tuple[str, str]]:
+        """Reduce WorkflowEdge objects or edge dicts to (source, target) tuples"""
+        normalized = []
+        for edge in edges:
+            try:
+                source_id, target_id = edge.source, edge.target
+            except AttributeError:
+                source_id, target_id = edge.get('source'), edge.get('target')
+            
+            if source_id and target_id:
+                normalized.append((source_id, target_id))
+        return normalized
+    
     def _build_execution_graph(self, nodes: List[WorkflowNode], deployment_id: str) -> Dict[str, Any]:
         """Build execution graph from nodes and edges"""
         
-        print(f"🔧 Building execution graph for {len(nodes)} nodes...")
+        logger.debug("Building execution graph for %d nodes", len(nodes))
         
-        # Get edges from deployment info
+        # Get edges from deployment info (normalized to (source, target) at registration)
         deployment_info = self.registered_routes.get(deployment_id)
         edges = []
+        edges_norm = []
         if deployment_info and 'edges' in deployment_info:
             edges = deployment_info['edges']
+            edges_norm = deployment_info.get('edges_norm') or self._normalize_edges(edges)
         
         # Create node map
         node_map = {node.id: node for node in nodes}
         
         # Build adjacency list for dependencies
-        dependencies = {node.id: [] for node in nodes}  # What this node depends on
-        dependents = {node.id: [] for node in nodes}    # What depends on this node
-        
-        for edge in edges:
-            source_id = edge.get('source') if hasattr(edge, 'get') else getattr(edge, 'source', None)
-            target_id = edge.get('target') if hasattr(edge, 'get') else getattr(edge, 'target', None)
-            
-            if source_id and target_id:
-                dependencies[target_id].append(source_id)
-                dependents[source_id].append(target_id)
+        dependencies = defaultdict(list)  # What this node depends on
+        dependents = defaultdict(list)    # What depends on this node
+        
+        for source_id, target_id in edges_norm:
+            # An edge to or from a node that isn't in the workflow would otherwise
+            # become a phantom node that reaches in-degree 0 and gets launched
+            if source_id not in node_map or target_id not in node_map:
+                logger.warning(
+                    "Skipping edge %s -> %s in deployment %s: unknown node", source_id, target_id, deployment_id
+                )
+                continue
+            dependencies[target_id].append(source_id)
+            dependents[source_id].append(target_id)
         
         # Find start nodes (no dependencies)
-        start_nodes = [node_id for node_id, deps in dependencies.items() if not deps]
+        start_nodes = [node_id for node_id in node_map if not dependencies[node_id]]
         
         # Find end nodes (no dependents)
-        end_nodes = [node_id for node_id, deps in dependents.items() if not deps]
+        end_nodes = [node_id for node_id in node_map if not dependents[node_id]]
         
-        print(f"📍 Start nodes (no inputs): {start_nodes}")
-        print(f"🎯 End nodes (no outputs): {end_nodes}")
-        print(f"🔗 Dependencies: {dict(dependencies)}")
+        # Number of unfinished dependencies per node; reaching 0 means the node is ready
+        indegree = {node_id: len(deps) for node_id, deps in dependencies.items()}
+        
+        logger.debug("Start nodes: %s, end nodes: %s, dependencies: %s", start_nodes, end_nodes, dependencies)
         
         return {
             'nodes': node_map,
@@ -488,6 +684,7 @@ class DynamicRouteService:
             'dependents': dependents,
             'start_nodes': start_nodes,
             'end_nodes': end_nodes,
+            'indegree': indegree,
             'edges': edges
         }
     
@@ -496,14 +693,12 @@ class DynamicRouteService:
         execution_graph: Dict[str, Any], 
         initial_input: Any, 
         parameters: Dict[str, Any],
-        deployment_id: str
+        deployment_id: str,
+        debug: bool = True
     ) -> Dict[str, Any]:
         """Execute workflow nodes in dependency order with data chaining"""
         
         nodes = execution_graph['nodes']
-        dependencies = execution_graph['dependencies']
-        dependents = execution_graph['dependents']
-        start_nodes = execution_graph['start_nodes']
         end_nodes = execution_graph['end_nodes']
         
         # Track execution state
@@ -511,65 +706,25 @@ class DynamicRouteService:
         node_outputs = {}
         execution_order = []
         
-        print(f"\n🎬 Starting workflow execution chain...")
+        logger.debug("Starting workflow execution chain")
         
-        # Execute start nodes with initial input
-        for start_node_id in start_nodes:
-            print(f"\n🟢 EXECUTING START NODE: {start_node_id}")
-            result = await self._execute_single_node(
-                nodes[start_node_id], 
-                initial_input, 
-                parameters,
-                deployment_id,
-                position="START"
-            )
-            
-            executed_nodes.add(start_node_id)
-            node_outputs[start_node_id] = result
-            execution_order.append(start_node_id)
-            
-            print(f"✅ Start node {start_node_id} completed")
+        run_context = self._new_run_context(deployment_id, parameters, debug)
         
-        # Execute remaining nodes when dependencies are satisfied
-        while len(executed_nodes) < len(nodes):
-            ready_nodes = []
+        async for event, node_id, payload in self._run_workflow_dag(
+            execution_graph, initial_input, self._execute_single_node, run_context
+        ):
+            if event == 'start':
+                logger.debug("Executing node %s (%s)", node_id, payload)
+                continue
             
-            for node_id, deps in dependencies.items():
-                if node_id not in executed_nodes:
-                    # Check if all dependencies are satisfied
-                    if all(dep_id in executed_nodes for dep_id in deps):
-                        ready_nodes.append(node_id)
+            executed_nodes.add(node_id)
+            node_outputs[node_id] = payload
+            execution_order.append(node_id)
             
-            if not ready_nodes:
-                print(f"⚠️  No more nodes ready to execute. Remaining: {set(nodes.keys()) - executed_nodes}")
-                break
-            
-            # Execute ready nodes
-            for node_id in ready_nodes:
-                print(f"\n🔄 EXECUTING NODE: {node_id}")
-                print(f"   Dependencies: {dependencies[node_id]}")
-                
-                # Prepare input from dependency outputs
-                node_input = self._prepare_node_input(
-                    node_id, 
-                    dependencies[node_id], 
-                    node_outputs, 
-                    initial_input
-                )
-                
-                result = await self._execute_single_node(
-                    nodes[node_id], 
-                    node_input, 
-                    parameters,
-                    deployment_id,
-                    position=f"CHAIN-{len(execution_order)+1}"
-                )
-                
-                executed_nodes.add(node_id)
-                node_outputs[node_id] = result
-                execution_order.append(node_id)
-                
-                print(f"✅ Node {node_id} completed")
+            logger.debug("Node %s completed", node_id)
+        
+        if len(executed_nodes) < len(nodes):
+            logger.warning("No more nodes ready to execute. Remaining: %s", set(nodes.keys()) - executed_nodes)
         
         # Determine final output (from end nodes)
         final_output = None
@@ -577,12 +732,12 @@ class DynamicRouteService:
             # Use output from the last end node
             final_node_id = end_nodes[-1]
             final_output = node_outputs.get(final_node_id)
-            print(f"\n🎯 Final output taken from end node: {final_node_id}")
+            logger.debug("Final output taken from end node: %s", final_node_id)
         elif execution_order:
             # Use output from the last executed node
             final_node_id = execution_order[-1]
             final_output = node_outputs.get(final_node_id)
-            print(f"\n🎯 Final output taken from last node: {final_node_id}")
+            logger.debug("Final output taken from last node: %s", final_node_id)
         
         return {
             'nodes_executed': list(executed_nodes),
@@ -596,21 +751,25 @@ class DynamicRouteService:
         execution_graph: Dict[str, Any], 
         initial_input: Any, 
         parameters: Dict[str, Any],
-        deployment_id: str
+        deployment_id: str,
+        debug: bool = True
     ) -> AsyncGenerator[Dict[str, Any], None]:
         """Execute workflow nodes with streaming progress updates"""
-        import time
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         nodes = execution_graph['nodes']
         dependencies = execution_graph['dependencies']
-        dependents = execution_graph['dependents']
-        start_nodes = execution_graph['start_nodes']
         end_nodes = execution_graph['end_nodes']
         
-        # Track execution state
+        # Track execution state. Full outputs are streamed as node_output events;
+        # only pointers to the candidates for final_output are kept.
         executed_nodes = set()
-        node_outputs = {}
+        end_node_rank = {end_node_id: rank for rank, end_node_id in enumerate(end_nodes)}
+        last_success_id = None
+        last_success_output = None
+        # Successful end node that comes last in end_nodes order
+        final_end_id = None
+        final_end_output = None
         execution_order = []
         
         yield {
@@ -619,135 +778,80 @@ class DynamicRouteService:
             'total_nodes': len(nodes)
         }
         
-        # Execute start nodes with initial input
-        for start_node_id in start_nodes:
-            yield {
-                'type': 'node_start',
-                'node_id': start_node_id,
-                'node_label': nodes[start_node_id].data.get('label', 'Unnamed'),
-                'position': 'START',
-                'message': f'Executing start node: {start_node_id}'
-            }
+        run_context = self._new_run_context(deployment_id, parameters, debug)
+        
+        async for event, node_id, payload in self._run_workflow_dag(
+            execution_graph, initial_input, self._execute_single_node_streaming, run_context
+        ):
+            if event == 'start':
+                if payload == 'START':
+                    yield {
+                        'type': 'node_start',
+                        'node_id': node_id,
+                        'node_label': nodes[node_id].data.get('label', 'Unnamed'),
+                        'position': payload,
+                        'message': f'Executing start node: {node_id}'
+                    }
+                else:
+                    yield {
+                        'type': 'node_start',
+                        'node_id': node_id,
+                        'node_label': nodes[node_id].data.get('label', 'Unnamed'),
+                        'dependencies': dependencies[node_id],
+                        'position': payload,
+                        'message': f'Executing node: {node_id}'
+                    }
+                continue
             
-            result = await self._execute_single_node_streaming(
-                nodes[start_node_id], 
-                initial_input, 
-                parameters,
-                deployment_id,
-                position="START"
-            )
+            executed_nodes.add(node_id)
+            execution_order.append(node_id)
             
-            executed_nodes.add(start_node_id)
-            node_outputs[start_node_id] = result
-            execution_order.append(start_node_id)
+            if not isinstance(payload, ErrorResult) and payload is not None:
+                last_success_id, last_success_output = node_id, payload
+                rank = end_node_rank.get(node_id)
+                if rank is not None and (final_end_id is None or rank > end_node_rank[final_end_id]):
+                    final_end_id, final_end_output = node_id, payload
             
-            # Create a safe preview of the result
-            serialized_result = self._serialize_node_output(result)
-            result_preview = str(serialized_result)[:100] + '...' if len(str(serialized_result)) > 100 else str(serialized_result)
+            # Output is encoded straight into the SSE frame by orjson
+            node_output = _unwrap_result(payload)
+            result_preview = self._result_preview(node_output)
             
             yield {
                 'type': 'node_complete',
-                'node_id': start_node_id,
+                'node_id': node_id,
                 'success': True,
-                'output_preview': result_preview,
-                'result': serialized_result
+                'output_preview': result_preview
+            }
+            yield {
+                'type': 'node_output',
+                'node_id': node_id,
+                'output': node_output
             }
         
-        # Execute remaining nodes when dependencies are satisfied
-        while len(executed_nodes) < len(nodes):
-            ready_nodes = []
-            
-            for node_id, deps in dependencies.items():
-                if node_id not in executed_nodes:
-                    if all(dep_id in executed_nodes for dep_id in deps):
-                        ready_nodes.append(node_id)
-            
-            if not ready_nodes:
-                yield {
-                    'type': 'warning',
-                    'message': f'No more nodes ready to execute. Remaining: {list(set(nodes.keys()) - executed_nodes)}'
-                }
-                break
-            
-            # Execute ready nodes
-            for node_id in ready_nodes:
-                yield {
-                    'type': 'node_start',
-                    'node_id': node_id,
-                    'node_label': nodes[node_id].data.get('label', 'Unnamed'),
-                    'dependencies': dependencies[node_id],
-                    'position': f'CHAIN-{len(execution_order)+1}',
-                    'message': f'Executing node: {node_id}'
-                }
-                
-                # Prepare input from dependency outputs
-                node_input = self._prepare_node_input(
-                    node_id, 
-                    dependencies[node_id], 
-                    node_outputs, 
-                    initial_input
-                )
-                
-                result = await self._execute_single_node_streaming(
-                    nodes[node_id], 
-                    node_input, 
-                    parameters,
-                    deployment_id,
-                    position=f"CHAIN-{len(execution_order)+1}"
-                )
-                
-                executed_nodes.add(node_id)
-                node_outputs[node_id] = result
-                execution_order.append(node_id)
-                
-                # Create a safe preview of the result
-                serialized_result = self._serialize_node_output(result)
-                result_preview = str(serialized_result)[:100] + '...' if len(str(serialized_result)) > 100 else str(serialized_result)
-                
-                yield {
-                    'type': 'node_complete',
-                    'node_id': node_id,
-                    'success': True,
-                    'output_preview': result_preview,
-                    'result': serialized_result
-                }
+        if len(executed_nodes) < len(nodes):
+            yield {
+                'type': 'warning',
+                'message': f'No more nodes ready to execute. Remaining: {list(set(nodes.keys()) - executed_nodes)}'
+            }
         
-        # Determine final output - prefer the last successfully executed node
-        final_output = None
-        final_node_id = None
+        # Determine final output - prefer the last successful end node,
+        # falling back to the last successfully executed node
+        if final_end_id is not None:
+            final_node_id, final_output = final_end_id, final_end_output
+        else:
+            final_node_id, final_output = last_success_id, last_success_output
         
-        # Try end nodes first
-        if end_nodes:
-            for end_node_id in reversed(end_nodes):
-                if end_node_id in node_outputs and not (isinstance(node_outputs[end_node_id], dict) and node_outputs[end_node_id].get('error')):
-                    final_output = node_outputs[end_node_id]
-                    final_node_id = end_node_id
-                    break
-        
-        # Fallback to last executed node
-        if final_output is None and execution_order:
-            for node_id in reversed(execution_order):
-                if node_id in node_outputs and not (isinstance(node_outputs[node_id], dict) and node_outputs[node_id].get('error')):
-                    final_output = node_outputs[node_id]
-                    final_node_id = node_id
-                    break
-        
-        print(f"🎯 Final output selected from node: {final_node_id}")
-        print(f"📤 Final output type: {type(final_output).__name__}")
-        
-        execution_time = (time.time() - start_time) * 1000
-        
-        # Serialize outputs for JSON response
-        serialized_node_outputs = {}
-        for node_id, output in node_outputs.items():
-            serialized_node_outputs[node_id] = self._serialize_node_output(output)
+        logger.debug("Final output selected from node %s (%s)", final_node_id, type(final_output).__name__)
+        
+        execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
         
         # For final output, if it's an AI response, extract the content
         if final_output and isinstance(final_output, dict) and 'content' in final_output:
             serialized_final_output = final_output['content']  # Extract AI response content
         else:
-            serialized_final_output = self._serialize_node_output(final_output) if final_output else None
+            serialized_final_output = _unwrap_result(final_output) if final_output else None
         
+        # Per-node outputs were already sent as node_output events
         yield {
             'type': 'workflow_complete',
             'success': True,
@@ -755,251 +859,346 @@ class DynamicRouteService:
             'nodes_executed': list(executed_nodes),
             'execution_order': execution_order,
             'final_output': serialized_final_output,
-            'node_outputs': serialized_node_outputs,
             'message': f'Workflow completed successfully in {execution_time:.2f}ms'
         }
     
+    async def _run_workflow_dag(
+        self,
+        execution_graph: Dict[str, Any],
+        initial_input: Any,
+        run_node: Callable[[WorkflowNode, Any, str], Awaitable[Any]],
+        run_context: ExecutionContext
+    ) -> AsyncGenerator[Tuple[str, str, Any], None]:
+        """
+        Drive a workflow graph dataflow-style: every node starts as soon as its
+        last dependency finishes, so independent branches overlap and wall-clock
+        time follows the critical path rather than the sum of all nodes.
+        
+        Yields ('start', node_id, position) when a node is launched and
+        ('complete', node_id, result) as each node finishes. run_node reads
+        run_context through _current_run.
+        """
+        nodes = execution_graph['nodes']
+        dependencies = execution_graph['dependencies']
+        dependents = execution_graph['dependents']
+        
+        # Kahn's algorithm: a node becomes ready when its last dependency completes
+        indegree = dict(execution_graph['indegree'])
+        # Output data delivered to each waiting node, filled in as its dependencies complete
+        pending_inputs = defaultdict(dict)
+        # Bound how many nodes run at once (protects provider rate limits)
+        semaphore = asyncio.Semaphore(self.max_concurrent_nodes)
+        # Running task -> (launch sequence number, node id)
+        running: Dict[asyncio.Future, Tuple[int, str]] = {}
+        launched = 0
+        
+        async def bounded(node_id: str, node_input: Any, position: str) -> Any:
+            # Each node task runs in its own copy of the context, so no reset is needed
+            _current_run.set(run_context)
+            async with semaphore:
+                try:
+                    return await run_node(nodes[node_id], node_input, position)
+                except Exception as e:
+                    error_output = self._node_error_output(nodes[node_id], e)
+                    logger.exception("Node %s failed [err=%s]", node_id, error_output["error_id"])
+                    return error_output
+        
+        def launch(node_id: str, node_input: Any, position: str) -> None:
+            nonlocal launched
+            launched += 1
+            running[asyncio.ensure_future(bounded(node_id, node_input, position))] = (launched, node_id)
+        
+        try:
+            # Start nodes get the initial input
+            for node_id in execution_graph['start_nodes']:
+                yield 'start', node_id, 'START'
+                launch(node_id, initial_input, 'START')
+            
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                
+                # done is a set; handle tasks finishing in the same wakeup in launch order,
+                # so completion events and execution order don't depend on task hashes
+                for task in sorted(done, key=lambda task: running[task][0]):
+                    _, node_id = running.pop(task)
+                    result = task.result()
+                    
+                    ready = []
+                    self._release_dependents(node_id, result, dependents, indegree, ready, pending_inputs)
+                    
+                    yield 'complete', node_id, result
+                    
+                    for child_id in ready:
+                        position = f"CHAIN-{launched + 1}"
+                        yield 'start', child_id, position
+                        launch(
+                            child_id,
+                            # Prepare input from dependency outputs
+                            self._prepare_node_input(child_id, dependencies[child_id], pending_inputs.pop(child_id), initial_input),
+                            position
+                        )
+        finally:
+            # Consumer went away early (e.g. client disconnected) - don't leave nodes running
+            for task in running:
+                task.cancel()
+    
+    def _new_run_context(self, deployment_id: str, parameters: Dict[str, Any], debug: bool) -> ExecutionContext:
+        """Workflow-level context for one run; node contexts derive their id and debug flag from it"""
+        run_context = ExecutionContext(execution_id=f"{deployment_id}_{uuid.uuid4().hex[:8]}", debug=debug)
+        run_context.set_workflow_data('deployment_id', deployment_id)
+        run_context.global_variables.update(parameters)
+        return run_context
+    
+    def _release_dependents(
+        self,
+        node_id: str,
+        output: Any,
+        dependents: Dict[str, List[str]],
+        indegree: Dict[str, int],
+        ready: List[str],
+        pending_inputs: Dict[str, Dict[str, Any]]
+    ) -> None:
+        """Hand node_id's output data to its dependents and collect those whose dependencies are now all done"""
+        # Unwrapped once here rather than once per dependent in _prepare_node_input
+        output_data = _unwrap_result(output)
+        for child_id in dependents[node_id]:
+            pending_inputs[child_id][node_id] = output_data
+            indegree[child_id] -= 1
+            if indegree[child_id] == 0:
+                ready.append(child_id)
+    
+    def _node_error_output(self, node: WorkflowNode, error: Exception, **extra: Any) -> "ErrorResult":
+        """Error info returned in place of a failed node result; the traceback is only logged, under error_id"""
+        return ErrorResult({
+            "error": True,
+            "error_id": uuid.uuid4().hex[:8],
+            "error_message": str(error),
+            "node_id": node.id,
+            "node_type": _type_str(node.type),
+            **extra
+        })
+    
     async def _execute_single_node_streaming(
         self, 
         node: WorkflowNode, 
         input_data: Any, 
-        parameters: Dict[str, Any],
-        deployment_id: str,
         position: str = ""
     ) -> Any:
         """Execute a single node with streaming updates and comprehensive logging"""
-        import time
         
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        run_context = _current_run.get()
         
-        print(f"\n🔄 {position} Starting execution of node: {node.id}")
-        print(f"   📋 Node Label: {node.data.get('label', 'Unknown')}")
-        print(f"   🏷️  Node Type: {node.type}")
-        print(f"   📥 Input Data Type: {type(input_data).__name__}")
-        print(f"   📥 Input Data Preview: {str(input_data)[:200]}...")
-        print(f"   ⚙️  Node Config: {node.config}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "%s Starting node %s (%s, type %s), input %s: %s, config: %s",
+                position, node.id, node.data.get('label', 'Unknown'), node.type,
+                type(input_data).__name__, _PREVIEW.repr(input_data), node.config
+            )
         
         # Ensure node has proper config for AI nodes
-        if hasattr(node, 'config') and not node.config:
-            default_config = self._get_default_config(node.type)
-            node.config = default_config
-            print(f"   🔧 Applied default config: {default_config}")
+        if not node.config:
+            self._apply_default_config(node, run_context)
+            logger.debug("Applied default config for %s: %s", node.id, node.config)
         
         try:
-            # Use real executor factory
-            from .execution.executor_factory import ExecutorFactory
-            from .execution.base_executor import ExecutionContext
-            
             # Get the executor for this node type
             executor = ExecutorFactory.get_executor(node.type)
-            execution_id = f"{deployment_id}_{node.id}_{int(time.time() * 1000)}"
-            context = ExecutionContext(execution_id=execution_id, debug=True)
+            memo_key = self._memo_key(node, executor, input_data)
+            cached = self._memo_get(memo_key, node.id)
+            if cached is not None:
+                logger.debug("%s Node %s served from memo cache", position, node.id)
+                return cached
+            
+            context = ExecutionContext(execution_id=f"{run_context.execution_id}_{node.id}", debug=run_context.debug)
             
-            print(f"   🚀 Executing with {executor.__class__.__name__}...")
+            logger.debug("Executing %s with %s", node.id, type(executor).__name__)
             
             # Execute the node
             result = await executor.execute(node, context, input_data)
+            self._memo_put(memo_key, result)
             
-            execution_time = (time.time() - start_time) * 1000
+            execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             
-            print(f"   ✅ Execution completed successfully!")
-            print(f"   ⏱️  Execution time: {execution_time:.2f}ms")
-            print(f"   📤 Result type: {type(result).__name__}")
-            print(f"   📤 Result preview: {str(result)[:200]}...")
-            print(f"✅ {position} Node {node.id} ({node.data.get('label', node.type)}) completed in {execution_time:.2f}ms")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s Node %s completed in %.2fms, result %s: %s",
+                    position, node.id, execution_time, type(result).__name__, _PREVIEW.repr(result)
+                )
             
             return result
             
         except Exception as e:
-            execution_time = (time.time() - start_time) * 1000
-            print(f"\n❌ {position} Node {node.id} FAILED after {execution_time:.2f}ms")
-            print(f"   💥 Error Type: {type(e).__name__}")
-            print(f"   💥 Error Message: {str(e)}")
-            print(f"   💥 Node Type: {node.type}")
-            print(f"   💥 Node Config: {node.config}")
-            print(f"   💥 Input Data: {input_data}")
-            import traceback
-            print(f"   💥 Full Traceback:\n{traceback.format_exc()}")
+            execution_time = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             # Return error info instead of crashing
-            return {
-                "error": True,
-                "error_message": str(e),
-                "node_id": node.id,
-                "node_type": str(node.type),
-                "execution_time_ms": execution_time,
-                "traceback": traceback.format_exc()
-            }
+            error_info = self._node_error_output(node, e, execution_time_ms=execution_time)
+            logger.exception(
+                "%s Node %s (type %s) failed after %.2fms [err=%s]",
+                position, node.id, node.type, execution_time, error_info["error_id"]
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Failed node %s config: %s, input: %s", node.id, node.config, _PREVIEW.repr(input_data))
+            return error_info
+    
+    def _apply_default_config(self, node: WorkflowNode, run_context: ExecutionContext) -> None:
+        """Give a node without a config its type's default config, keeping its status body current"""
+        node.config = self._get_default_config(node.type)
+        deployment_id = run_context.get_workflow_data('deployment_id')
+        if (deployment_id, node.id) in self._status_bodies:
+            self._render_status_body((deployment_id, node.id), node)
+    
+    def _refresh_status_bodies(self, node_type: str) -> None:
+        """Re-render the status bodies of deployed nodes of a type after its configuration changed"""
+        for deployment_id, info in self.registered_routes.items():
+            for node in info['nodes']:
+                if _type_str(node.type) == node_type:
+                    self._render_status_body((deployment_id, node.id), node)
     
     def _prepare_node_input(
         self, 
         node_id: str, 
         dependency_ids: List[str], 
-        node_outputs: Dict[str, Any], 
+        dependency_outputs: Dict[str, Any], 
         initial_input: Any
     ) -> Any:
-        """Prepare input data for a node based on its dependencies"""
-        
-        def extract_output_data(output):
-            """Extract actual output data from NodeExecutionResult or return as-is"""
-            if hasattr(output, 'output_data'):
-                return output.output_data
-            return output
+        """Prepare input data for a node from the output data delivered by its dependencies"""
         
         if not dependency_ids:
-            print(f"   📥 Using initial input for {node_id}")
+            logger.debug("Using initial input for %s", node_id)
             return initial_input
         
         if len(dependency_ids) == 1:
-            # Single dependency - extract its actual output data
-            dep_output = node_outputs.get(dependency_ids[0])
-            actual_output = extract_output_data(dep_output)
-            print(f"   📥 Using output from {dependency_ids[0]} for {node_id}")
-            print(f"   📦 Extracted data type: {type(actual_output).__name__}")
+            # Single dependency - its output data is the input
+            actual_output = dependency_outputs.get(dependency_ids[0])
+            logger.debug("Using output from %s for %s (%s)", dependency_ids[0], node_id, type(actual_output).__name__)
             return actual_output
         
-        # Multiple dependencies - combine actual output data
+        # Multiple dependencies - combine output data in dependency order
         combined_input = {
-            'dependency_outputs': {dep_id: extract_output_data(node_outputs.get(dep_id)) for dep_id in dependency_ids},
+            'dependency_outputs': {dep_id: dependency_outputs.get(dep_id) for dep_id in dependency_ids},
             'initial_input': initial_input
         }
-        print(f"   📥 Combining outputs from {dependency_ids} for {node_id}")
+        logger.debug("Combining outputs from %s for %s", dependency_ids, node_id)
         return combined_input
     
     async def _execute_single_node(
         self, 
         node: WorkflowNode, 
         input_data: Any, 
-        parameters: Dict[str, Any],
-        deployment_id: str,
         position: str = ""
     ) -> Any:
         """Execute a single node with comprehensive logging"""
-        import time
         
-        node_start_time = time.time()
+        node_start_ns = time.perf_counter_ns()
+        run_context = _current_run.get()
         
-        print(f"   🎯 NODE: {node.id} | TYPE: {node.type} | POSITION: {position}")
-        print(f"   📝 Label: {node.data.get('label', 'Unnamed')}")
-        print(f"   📥 Input type: {type(input_data).__name__}")
+        logger.debug(
+            "Node %s (%s) | type %s | position %s | input %s",
+            node.id, node.data.get('label', 'Unnamed'), node.type, position, type(input_data).__name__
+        )
         
         try:
-            # Use real executor factory
-            from .execution.executor_factory import ExecutorFactory
-            from .execution.base_executor import ExecutionContext
-            
             # Get the executor for this node type
             executor = ExecutorFactory.get_executor(node.type)
-            execution_id = f"{deployment_id}_{node.id}_{int(time.time() * 1000)}"
-            context = ExecutionContext(execution_id=execution_id, debug=True)
             
-            print(f"   ⚙️  Executor: {executor.__class__.__name__}")
+            logger.debug("Executor for %s: %s", node.id, type(executor).__name__)
             
             # Ensure node has proper config for AI nodes
-            if hasattr(node, 'config') and not node.config:
-                node.config = self._get_default_config(node.type)
-                print(f"   ⚙️  Applied default config for {node.type}")
+            if not node.config:
+                self._apply_default_config(node, run_context)
+                logger.debug("Applied default config for %s", node.type)
+            
+            memo_key = self._memo_key(node, executor, input_data)
+            cached = self._memo_get(memo_key, node.id)
+            if cached is not None:
+                logger.debug("Node %s served from memo cache", node.id)
+                return cached
+            
+            context = ExecutionContext(execution_id=f"{run_context.execution_id}_{node.id}", debug=run_context.debug)
             
             # Execute the node
             result = await executor.execute(node, context, input_data)
+            self._memo_put(memo_key, result)
             
-            node_execution_time = (time.time() - node_start_time) * 1000
+            node_execution_time = (time.perf_counter_ns() - node_start_ns) / 1_000_000
             
-            print(f"   📤 Output type: {type(result).__name__}")
-            print(f"   ⏱️  Execution time: {node_execution_time:.2f}ms")
+            logger.debug("Node %s output %s in %.2fms", node.id, type(result).__name__, node_execution_time)
             
             return result
             
         except Exception as e:
-            node_execution_time = (time.time() - node_start_time) * 1000
-            print(f"   ❌ Error in {node.id}: {str(e)}")
-            print(f"   ⏱️  Failed after: {node_execution_time:.2f}ms")
+            node_execution_time = (time.perf_counter_ns() - node_start_ns) / 1_000_000
             
             # Return error info instead of crashing
-            return {
-                "error": True,
-                "error_message": str(e),
-                "node_id": node.id,
-                "node_type": str(node.type)
-            }
+            error_info = self._node_error_output(node, e)
+            logger.exception("Error in %s after %.2fms [err=%s]", node.id, node_execution_time, error_info["error_id"])
+            return error_info
     
-    def _serialize_node_output(self, output: Any) -> Any:
-        """Serialize node output for JSON response, handling NodeExecutionResult objects"""
-        if output is None:
+    def _memo_key(self, node: WorkflowNode, executor: Any, input_data: Any) -> Optional[bytes]:
+        """Cache key for a node execution, or None when its output is not reproducible"""
+        # AI nodes are not memoized here: their temperature-0 completions are cached by llm_cache
+        if not executor.is_deterministic_for(node.config):
             return None
         
-        # If it's a NodeExecutionResult object, extract the output_data
-        if hasattr(output, 'output_data'):
-            return self._serialize_node_output(output.output_data)
-        
-        # If it's a dict with error info, return as-is
-        if isinstance(output, dict) and output.get('error'):
-            return output
-        
-        # If it's a simple type, return as-is
-        if isinstance(output, (str, int, float, bool, list)):
-            return output
-        
-        # If it's a dict, recursively serialize values
-        if isinstance(output, dict):
-            return {k: self._serialize_node_output(v) for k, v in output.items()}
-        
-        # For any other type, convert to string
-        return str(output)
+        try:
+            payload = orjson.dumps(
+                (_type_str(node.type), node.config, input_data),
+                default=_memo_key_default,
+                option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        except TypeError:
+            return None
+        return hashlib.blake2b(payload, digest_size=16).digest()
+    
+    def _memo_get(self, key: Optional[bytes], node_id: str) -> Any:
+        """Copy of the cached result for a memo key, re-labelled for the requesting node
+
+        Like an llm_cache hit, a memo hit reports no execution time and no logs,
+        since the original run's timing and logs did not happen for this request.
+        """
+        if key is None:
+            return None
+        result = self._memo.get(key)
+        if result is None:
+            return None
+        self._memo.move_to_end(key)
+        # Outputs are handed to child nodes and responses by reference, so never share the cached one
+        return result.model_copy(update={'node_id': node_id, 'execution_time_ms': 0.0, 'logs': []}, deep=True)
+    
+    def _memo_put(self, key: Optional[bytes], result: Any) -> None:
+        """Remember a successful result, evicting the least recently used entry when full"""
+        if key is None or getattr(result, 'status', None) != ExecutionStatus.COMPLETED:
+            return
+        # Store a copy: the caller passes the original on to nodes that may modify it
+        self._memo[key] = result.model_copy(deep=True)
+        self._memo.move_to_end(key)
+        if len(self._memo) > self.memo_max_entries:
+            self._memo.popitem(last=False)
+    
+    def clear_execution_cache(self) -> int:
+        """Drop all memoized node results, returning how many were removed"""
+        removed = len(self._memo)
+        self._memo.clear()
+        return removed
+    
+    def _result_preview(self, result: Any, limit: int = 100) -> str:
+        """Short preview of a node result for progress events, without stringifying all of it"""
+        text = result if isinstance(result, str) else _PREVIEW.repr(result)
+        return text[:limit] + '...' if len(text) > limit else text
     
     def _get_default_config(self, node_type: str) -> Dict[str, Any]:
         """Get default configuration for a node type"""
         
-        # Convert node_type to string if it's an enum
-        node_type_str = node_type.value if hasattr(node_type, 'value') else str(node_type)
+        node_type_str = _type_str(node_type)
         
         # Check if we have custom configs stored, otherwise use defaults
-        if hasattr(self, 'custom_ai_configs') and node_type_str in self.custom_ai_configs:
-            return self.custom_ai_configs[node_type_str]
-        
-        # AI node default configurations
-        ai_configs = {
-            'groqllama': {
-                "model": "llama3-70b-8192",
-                "temperature": 0.7,
-                "max_tokens": 1000,
-                "system_prompt": "You are a helpful AI assistant that processes information.",
-                "user_prompt": "Please analyze and respond to the following:"
-            },
-            'claude4': {
-                "model": "claude-3-haiku-20240307",
-                "temperature": 0.7,
-                "max_tokens": 1000,
-                "system_prompt": "You are Claude, a helpful AI assistant.",
-                "user_prompt": "Please provide a thoughtful response to:"
-            },
-            'gemini': {
-                "model": "gemini-1.5-flash",
-                "temperature": 0.7,
-                "max_tokens": 1000,
-                "system_prompt": "You are Gemini, a helpful AI assistant.",
-                "user_prompt": "Please analyze and respond to:"
-            },
-            'chatbot': {
-                "model": "gpt-4o",
-                "temperature": 0.7,
-                "max_tokens": 1000,
-                "system_prompt": "You are a helpful AI chatbot.",
-                "user_prompt": "Please respond to:"
-            }
-        }
-        
-        # GraphRAG configuration
-        if node_type_str == 'graphrag':
-            return {
-                "operation": "query",
-                "extract_entities": True,
-                "extract_relationships": True,
-                "max_results": 10
-            }
+        custom_config = self.custom_ai_configs.get(node_type_str)
+        if custom_config is not None:
+            return custom_config
         
-        # Return AI config if available, otherwise empty dict
-        return ai_configs.get(node_type_str, {})
+        # Copy the shared read-only defaults so callers can't modify them
+        return dict(_builtin_default_config(node_type_str))
 
     def get_deployment_info(self, deployment_id: str) -> Optional[Dict[str, Any]]:
         """Get information about a registered deployment"""
@@ -1025,27 +1224,27 @@ class DynamicRouteService:
         """Update configuration for a specific AI node type"""
         try:
             # Validate node type
-            valid_types = ['groqllama', 'claude4', 'gemini', 'chatbot', 'graphrag']
-            if node_type not in valid_types:
+            if node_type not in _CONFIGURABLE_NODE_TYPES:
                 return {
                     "success": False,
-                    "message": f"Invalid node type. Valid types: {valid_types}"
+                    "message": f"Invalid node type. Valid types: {sorted(_CONFIGURABLE_NODE_TYPES)}"
                 }
             
             # Validate config structure for AI nodes
-            if node_type in ['groqllama', 'claude4', 'gemini', 'chatbot']:
-                required_fields = ['model', 'temperature', 'max_tokens', 'system_prompt', 'user_prompt']
-                missing_fields = [field for field in required_fields if field not in config]
+            if node_type in _AI_NODE_TYPES:
+                missing_fields = _REQUIRED_AI_CONFIG_FIELDS.difference(config)
                 if missing_fields:
                     return {
                         "success": False,
-                        "message": f"Missing required fields: {missing_fields}"
+                        "message": f"Missing required fields: {sorted(missing_fields)}"
                     }
             
-            # Store the configuration
+            # Store the configuration, with built-in defaults filling any unset fields
+            config = {**_builtin_default_config(node_type), **config}
             self.custom_ai_configs[node_type] = config
+            self._refresh_status_bodies(node_type)
             
-            print(f"✅ Updated AI node config for {node_type}: {config}")
+            logger.info("Updated AI node config for %s: %s", node_type, config)
             
             return {
                 "success": True,
@@ -1084,11 +1283,12 @@ class DynamicRouteService:
             # Remove custom config if it exists
             if node_type in self.custom_ai_configs:
                 del self.custom_ai_configs[node_type]
+                self._refresh_status_bodies(node_type)
             
             # Get default config
             default_config = self._get_default_config(node_type)
             
-            print(f"🔄 Reset AI node config for {node_type} to defaults")
+            logger.info("Reset AI node config for %s to defaults", node_type)
             
             return {
                 "success": True,
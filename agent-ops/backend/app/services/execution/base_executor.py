@@ -2,7 +2,9 @@
 Base executor class for workflow node execution
 """
 from abc import ABC, abstractmethod
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
+import logging
 import time
 from datetime import datetime
 
@@ -14,20 +16,52 @@ from ...models.workflow_models import (
     LogLevel
 )
 
+logger = logging.getLogger(__name__)
+
+# ExecutionLog levels mapped onto stdlib logging levels
+_LOG_LEVELS = {
+    LogLevel.DEBUG: logging.DEBUG,
+    LogLevel.INFO: logging.INFO,
+    LogLevel.WARNING: logging.WARNING,
+    LogLevel.ERROR: logging.ERROR,
+}
+
+
+def frozen_schema(schema: Any) -> Any:
+    """Read-only copy of a schema literal (dicts become mapping proxies, lists tuples), safe to share"""
+    if isinstance(schema, dict):
+        return MappingProxyType({key: frozen_schema(value) for key, value in schema.items()})
+    if isinstance(schema, list):
+        return tuple(frozen_schema(item) for item in schema)
+    return schema
+
 
 class ExecutionContext:
     """Context object that holds workflow execution state"""
     
-    def __init__(self, execution_id: str, debug: bool = True):
+    def __init__(self, execution_id: str, debug: bool = True, max_logs: int = 10000):
         self.execution_id = execution_id
         self.debug = debug
+        # DEBUG entries are only recorded for debug executions
+        self._min_level = logging.DEBUG if debug else logging.INFO
         self.node_results: Dict[str, NodeExecutionResult] = {}
         self.global_variables: Dict[str, Any] = {}
         self.workflow_data: Dict[str, Any] = {}
         self.logs: List[ExecutionLog] = []
+        # Oldest entries are dropped past max_logs; _dropped_logs keeps positions stable
+        self.max_logs = max_logs
+        self._dropped_logs = 0
+    
+    def is_enabled(self, level: LogLevel) -> bool:
+        """Whether entries at this level are recorded, so callers can skip building costly messages"""
+        return _LOG_LEVELS.get(level, logging.INFO) >= self._min_level
     
     def log(self, level: LogLevel, message: str, node_id: Optional[str] = None, details: Optional[Dict] = None):
         """Add a log entry"""
+        log_level = _LOG_LEVELS.get(level, logging.INFO)
+        if log_level < self._min_level:
+            return
+        
         log = ExecutionLog(
             level=level,
             node_id=node_id,
@@ -35,9 +69,24 @@ class ExecutionContext:
             details=details
         )
         self.logs.append(log)
+        if len(self.logs) > self.max_logs:
+            # Trim in chunks so the list isn't shifted on every call once full
+            excess = len(self.logs) - self.max_logs + self.max_logs // 10
+            del self.logs[:excess]
+            self._dropped_logs += excess
         
         if self.debug:
-            print(f"[{log.timestamp}] [{level.upper()}] {node_id or 'SYSTEM'}: {message}")
+            logger.log(log_level, "[%s] %s: %s", self.execution_id, node_id or 'SYSTEM', message)
+    
+    @property
+    def log_position(self) -> int:
+        """Total number of entries logged so far, including dropped ones"""
+        return self._dropped_logs + len(self.logs)
+    
+    def logs_since(self, position: int, limit: int = 10) -> List[ExecutionLog]:
+        """Up to `limit` most recent entries logged after `position`"""
+        start = max(position - self._dropped_logs, len(self.logs) - limit, 0)
+        return self.logs[start:]
     
     def get_node_output(self, node_id: str) -> Any:
         """Get output data from a specific node"""
@@ -68,20 +117,30 @@ class ExecutionContext:
 
 
 class BaseNodeExecutor(ABC):
-    """Base class for all node executors"""
+    """Base class for all node executors.
+    
+    ExecutorFactory shares one instance per node type across all executions,
+    so executors must be stateless: per-run state belongs in ExecutionContext.
+    """
+    
+    # True when output depends only on (config, input_data), so results may be memoized
+    is_deterministic: bool = False
     
     def __init__(self):
         self.node_type = self.__class__.__name__.replace("Executor", "").lower()
     
     async def execute(self, node: WorkflowNode, context: ExecutionContext, input_data: Any = None) -> NodeExecutionResult:
         """Execute a node and return the result"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        logs_start = context.log_position
         
         context.log(LogLevel.INFO, f"Starting execution of {self.node_type} node", node.id)
-        context.log(LogLevel.DEBUG, f"Node config: {node.config}", node.id, {"config": node.config})
-        
-        if input_data is not None:
-            context.log(LogLevel.DEBUG, f"Input data type: {type(input_data)}", node.id, {"input_type": str(type(input_data))})
+        # Skip formatting debug messages that the context would discard anyway
+        if context.debug:
+            context.log(LogLevel.DEBUG, f"Node config: {node.config}", node.id, {"config": node.config})
+            
+            if input_data is not None:
+                context.log(LogLevel.DEBUG, f"Input data type: {type(input_data)}", node.id, {"input_type": str(type(input_data))})
         
         try:
             # Validate node configuration
@@ -91,7 +150,7 @@ class BaseNodeExecutor(ABC):
             # Execute the node-specific logic
             output_data = await self._execute_impl(node, context, input_data)
             
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             context.log(LogLevel.INFO, f"Successfully completed {self.node_type} node", node.id, {
                 "execution_time_ms": execution_time_ms,
@@ -103,11 +162,11 @@ class BaseNodeExecutor(ABC):
                 status=ExecutionStatus.COMPLETED,
                 output_data=output_data,
                 execution_time_ms=execution_time_ms,
-                logs=context.logs[-10:]  # Last 10 logs for this node
+                logs=context.logs_since(logs_start)  # Most recent logs for this node (up to logs_since's limit)
             )
             
         except Exception as e:
-            execution_time_ms = (time.time() - start_time) * 1000
+            execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             error_msg = str(e)
             
             context.log(LogLevel.ERROR, f"Failed to execute {self.node_type} node: {error_msg}", node.id, {
@@ -120,7 +179,7 @@ class BaseNodeExecutor(ABC):
                 status=ExecutionStatus.FAILED,
                 error_message=error_msg,
                 execution_time_ms=execution_time_ms,
-                logs=context.logs[-10:]  # Last 10 logs for this node
+                logs=context.logs_since(logs_start)  # Most recent logs for this node (up to logs_since's limit)
             )
     
     @abstractmethod
@@ -133,6 +192,10 @@ class BaseNodeExecutor(ABC):
         """Validate the node configuration"""
         pass
     
+    def is_deterministic_for(self, config: Dict[str, Any]) -> bool:
+        """Whether a node with this config always produces the same output for the same input"""
+        return self.is_deterministic
+    
     def get_required_inputs(self) -> List[str]:
         """Get list of required input fields"""
         return []
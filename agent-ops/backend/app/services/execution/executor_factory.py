@@ -22,11 +22,12 @@ class ExecutorFactory:
     def get_executor(cls, node_type: str) -> BaseNodeExecutor:
         """Get an executor for the given node type"""
         
-        # Create executor if not cached
-        if node_type not in cls._executors:
-            cls._executors[node_type] = cls._create_executor(node_type)
+        # Single lookup on the hot path; create executor if not cached
+        executor = cls._executors.get(node_type)
+        if executor is None:
+            executor = cls._executors[node_type] = cls._create_executor(node_type)
         
-        return cls._executors[node_type]
+        return executor
     
     @classmethod
     def _create_executor(cls, node_type: str) -> BaseNodeExecutor:
@@ -1,59 +1,89 @@
 """
 API node executor for making HTTP requests
 """
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 import requests
 import json
 from ..base_executor import BaseNodeExecutor, ExecutionContext
 from ....models.workflow_models import WorkflowNode, LogLevel
 
 
+_VALID_METHODS = frozenset({"GET", "POST", "PUT", "DELETE", "PATCH"})
+
+
+@dataclass(frozen=True)
+class _APIConfig:
+    """API node configuration, read from the node's config dict once per run
+
+    Mapping fields are read-only views, so a run can't modify the node's config.
+    """
+    url: str
+    method: str
+    headers: Mapping[str, Any]
+    params: Mapping[str, Any]
+    body: Any
+    timeout: Any
+    include_input_in_body: bool
+    
+    @classmethod
+    def parse(cls, config: Dict[str, Any]) -> "_APIConfig":
+        body = config.get("body", {})
+        return cls(
+            url=config.get("url", ""),
+            method=config.get("method", "GET").upper(),
+            headers=MappingProxyType(config.get("headers") or {}),
+            params=MappingProxyType(config.get("params") or {}),
+            body=MappingProxyType(body) if isinstance(body, dict) else body,
+            timeout=config.get("timeout", 30),
+            include_input_in_body=config.get("include_input_in_body", False),
+        )
+
+
 class APIExecutor(BaseNodeExecutor):
     """Executor for API nodes that make HTTP requests"""
     
     async def _execute_impl(self, node: WorkflowNode, context: ExecutionContext, input_data: Any) -> Any:
-        config = node.config
-        
         # Get API configuration
-        url = config.get("url", "")
-        method = config.get("method", "GET").upper()
-        headers = config.get("headers", {})
-        params = config.get("params", {})
-        body = config.get("body", {})
-        timeout = config.get("timeout", 30)
+        config = _APIConfig.parse(node.config)
+        # Request body as a plain (JSON-serializable) value, never the node's own dict
+        body = dict(config.body) if isinstance(config.body, Mapping) else config.body
         
-        context.log(LogLevel.INFO, f"Making {method} request to {url}", node.id)
-        context.log(LogLevel.DEBUG, f"Headers: {headers}", node.id)
-        context.log(LogLevel.DEBUG, f"Params: {params}", node.id)
+        context.log(LogLevel.INFO, f"Making {config.method} request to {config.url}", node.id)
+        if context.is_enabled(LogLevel.DEBUG):
+            context.log(LogLevel.DEBUG, f"Headers: {dict(config.headers)}", node.id)
+            context.log(LogLevel.DEBUG, f"Params: {dict(config.params)}", node.id)
         
         # Add input data to request if available
         if input_data:
             context.log(LogLevel.DEBUG, f"Input data provided: {type(input_data)}", node.id)
             
             # If input data is a dict and we have a body_template, merge it
-            if isinstance(input_data, dict) and config.get("include_input_in_body", False):
+            if isinstance(input_data, dict) and config.include_input_in_body:
                 if isinstance(body, dict):
-                    body.update({"input_data": input_data})
+                    body["input_data"] = input_data
                 else:
                     body = {"input_data": input_data}
                 context.log(LogLevel.DEBUG, f"Updated body with input data", node.id)
         
         try:
             # Make the HTTP request
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params, timeout=timeout)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, params=params, json=body, timeout=timeout)
-            elif method == "PUT":
-                response = requests.put(url, headers=headers, params=params, json=body, timeout=timeout)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, params=params, timeout=timeout)
+            if config.method == "GET":
+                response = requests.get(config.url, headers=config.headers, params=config.params, timeout=config.timeout)
+            elif config.method == "POST":
+                response = requests.post(config.url, headers=config.headers, params=config.params, json=body, timeout=config.timeout)
+            elif config.method == "PUT":
+                response = requests.put(config.url, headers=config.headers, params=config.params, json=body, timeout=config.timeout)
+            elif config.method == "DELETE":
+                response = requests.delete(config.url, headers=config.headers, params=config.params, timeout=config.timeout)
             else:
-                raise ValueError(f"Unsupported HTTP method: {method}")
+                raise ValueError(f"Unsupported HTTP method: {config.method}")
             
             # Log response details
             context.log(LogLevel.INFO, f"API response: {response.status_code}", node.id)
-            context.log(LogLevel.DEBUG, f"Response headers: {dict(response.headers)}", node.id)
+            if context.is_enabled(LogLevel.DEBUG):
+                context.log(LogLevel.DEBUG, f"Response headers: {dict(response.headers)}", node.id)
             
             # Check if request was successful
             if response.status_code >= 400:
@@ -74,8 +104,8 @@ class APIExecutor(BaseNodeExecutor):
                 "status_code": response.status_code,
                 "headers": dict(response.headers),
                 "data": response_data,
-                "url": url,
-                "method": method,
+                "url": config.url,
+                "method": config.method,
                 "success": True
             }
             
@@ -83,11 +113,11 @@ class APIExecutor(BaseNodeExecutor):
             return result
             
         except requests.exceptions.Timeout:
-            error_msg = f"API request timed out after {timeout}s"
+            error_msg = f"API request timed out after {config.timeout}s"
             context.log(LogLevel.ERROR, error_msg, node.id)
             raise Exception(error_msg)
         except requests.exceptions.ConnectionError:
-            error_msg = f"Failed to connect to {url}"
+            error_msg = f"Failed to connect to {config.url}"
             context.log(LogLevel.ERROR, error_msg, node.id)
             raise Exception(error_msg)
         except Exception as e:
@@ -97,17 +127,18 @@ class APIExecutor(BaseNodeExecutor):
     
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate API node configuration"""
+        parsed = _APIConfig.parse(config)
+        
         # Must have URL
-        if not config.get("url"):
+        if not parsed.url:
             return False
         
         # Method must be valid
-        method = config.get("method", "GET").upper()
-        if method not in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
+        if parsed.method not in _VALID_METHODS:
             return False
         
         # Timeout must be positive
-        timeout = config.get("timeout", 30)
+        timeout = parsed.timeout
         if not isinstance(timeout, (int, float)) or timeout <= 0:
             return False
         
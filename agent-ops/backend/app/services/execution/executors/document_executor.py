@@ -1,17 +1,96 @@
 """
 Document processing node executor
 """
-from typing import Any, Dict, List
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+import asyncio
+import atexit
+import os
 import re
-from ..base_executor import BaseNodeExecutor, ExecutionContext
+from ..base_executor import BaseNodeExecutor, ExecutionContext, frozen_schema
 from ....models.workflow_models import WorkflowNode, LogLevel
 
+try:
+    # RE2 matches in linear time, so crafted documents can't trigger catastrophic backtracking
+    import re2 as entity_re
+except ImportError:
+    entity_re = re
+
+# Runs of non-whitespace, i.e. what str.split() would return as words
+_WORD_RE = re.compile(r'\S+')
+
+# Entity patterns for _extract_simple_entities
+_EMAIL_RE = entity_re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+_URL_RE = entity_re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*(),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+_PHONE_RE = entity_re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+_CAPITALIZED_RE = entity_re.compile(r'\b[A-Z][a-z]+\b')
+
+# Documents (or batches of documents) at least this long are processed in worker processes
+_OFFLOAD_MIN_CHARS = 200_000
+# Upper bound on worker processes, so document work can't take every core from the server
+_MAX_POOL_WORKERS = 4
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+
+
+def _process_pool() -> ProcessPoolExecutor:
+    """Shared worker pool for large documents, created on first use"""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is None:
+        _PROCESS_POOL = ProcessPoolExecutor(max_workers=min(_MAX_POOL_WORKERS, os.cpu_count() or 1))
+        atexit.register(shutdown_process_pool)
+    return _PROCESS_POOL
+
+
+def shutdown_process_pool() -> None:
+    """Stop the shared worker pool, if it was started; it is recreated on next use"""
+    global _PROCESS_POOL
+    if _PROCESS_POOL is not None:
+        _PROCESS_POOL.shutdown(cancel_futures=True)
+        _PROCESS_POOL = None
+
+
+def _process_text(text: str, chunk_size: int, extract_entities: bool) -> Tuple[int, int, List[str], List[Dict[str, str]]]:
+    """CPU-bound document work: word and paragraph counts, chunks and (optionally) entities"""
+    # The chunker works from word offsets anyway, so the word count comes from the same scan
+    spans = [match.span() for match in _WORD_RE.finditer(text)]
+    word_count = len(spans)
+    paragraph_count = sum(1 for p in text.split('\n\n') if p and not p.isspace())
+    chunks = DocumentExecutor._chunk_text(text, chunk_size, spans)
+    entities = DocumentExecutor._extract_simple_entities(text) if extract_entities else []
+    return word_count, paragraph_count, chunks, entities
+
 
 class DocumentExecutor(BaseNodeExecutor):
     """Executor for document processing nodes"""
     
+    _OUTPUT_SCHEMA: Mapping[str, Any] = frozen_schema({
+        "type": "object",
+        "properties": {
+            "original_text": {"type": "string"},
+            "processed_text": {"type": "string"},
+            "chunks": {"type": "array", "items": {"type": "string"}},
+            "documents": {
+                "type": "array",
+                "description": "Per-document results when processing batch_texts",
+                "items": {"type": "object"}
+            },
+            "metadata": {"type": "object"}
+        }
+    })
+    
+    is_deterministic = True
+    
     async def _execute_impl(self, node: WorkflowNode, context: ExecutionContext, input_data: Any) -> Any:
         config = node.config
+        chunk_size = config.get("chunk_size", 1000)
+        extract_entities = config.get("extract_entities", False)
+        compact_output = config.get("compact_output", False)
+        
+        batch_texts = config.get("batch_texts")
+        if batch_texts:
+            return await self._execute_batch(node, context, batch_texts, chunk_size, extract_entities, compact_output)
         
         # Get text input (from config or input data)
         text = ""
@@ -30,41 +109,26 @@ class DocumentExecutor(BaseNodeExecutor):
         # Process the text
         context.log(LogLevel.INFO, f"Processing document with {len(text)} characters", node.id)
         
-        # Extract metadata
-        word_count = len(text.split())
+        # Extract metadata, chunk the text and extract entities if requested
         char_count = len(text)
-        paragraph_count = len([p for p in text.split('\n\n') if p.strip()])
-        
-        context.log(LogLevel.DEBUG, f"Document stats: {word_count} words, {char_count} chars, {paragraph_count} paragraphs", node.id)
-        
-        # Chunk the text
-        chunk_size = config.get("chunk_size", 1000)
-        chunks = self._chunk_text(text, chunk_size)
+        if char_count >= _OFFLOAD_MIN_CHARS:
+            # Off the event loop, so several large documents in one workflow are processed in parallel
+            loop = asyncio.get_running_loop()
+            processed = await loop.run_in_executor(
+                _process_pool(), _process_text, text, chunk_size, extract_entities
+            )
+        else:
+            processed = _process_text(text, chunk_size, extract_entities)
+        word_count, paragraph_count, chunks, entities = processed
         
+        if context.is_enabled(LogLevel.DEBUG):
+            context.log(LogLevel.DEBUG, f"Document stats: {word_count} words, {char_count} chars, {paragraph_count} paragraphs", node.id)
+            if extract_entities:
+                context.log(LogLevel.DEBUG, f"Extracted {len(entities)} entities", node.id)
         context.log(LogLevel.INFO, f"Created {len(chunks)} chunks with size {chunk_size}", node.id)
         
-        # Extract entities if requested
-        entities = []
-        if config.get("extract_entities", False):
-            entities = self._extract_simple_entities(text)
-            context.log(LogLevel.DEBUG, f"Extracted {len(entities)} entities", node.id)
-        
         # Create processed output
-        processed_text = "\n\n".join(chunks)
-        
-        result = {
-            "original_text": text,
-            "processed_text": processed_text,
-            "chunks": chunks,
-            "metadata": {
-                "word_count": word_count,
-                "char_count": char_count,
-                "paragraph_count": paragraph_count,
-                "chunk_count": len(chunks),
-                "chunk_size": chunk_size,
-                "entities": entities
-            }
-        }
+        result = self._document_result(text, processed, chunk_size, compact_output)
         
         context.log(LogLevel.INFO, f"Document processing completed successfully", node.id, {
             "chunks_created": len(chunks),
@@ -73,6 +137,73 @@ class DocumentExecutor(BaseNodeExecutor):
         
         return result
     
+    async def _execute_batch(self, node: WorkflowNode, context: ExecutionContext, texts: List[str], chunk_size: int,
+                             extract_entities: bool, compact_output: bool) -> Dict[str, Any]:
+        """Process every document in batch_texts, one result per document"""
+        if not isinstance(texts, list) or not all(isinstance(text, str) for text in texts):
+            raise ValueError("batch_texts must be a list of strings")
+        
+        context.log(LogLevel.INFO, f"Processing batch of {len(texts)} documents", node.id)
+        processed = await self.chunk_batch(texts, chunk_size, extract_entities)
+        documents = [
+            self._document_result(text, doc, chunk_size, compact_output)
+            for text, doc in zip(texts, processed)
+        ]
+        chunk_count = sum(len(doc["chunks"]) for doc in documents)
+        
+        context.log(LogLevel.INFO, f"Batch processing completed successfully", node.id, {
+            "documents_processed": len(documents),
+            "chunks_created": chunk_count
+        })
+        
+        return {
+            "documents": documents,
+            "metadata": {
+                "document_count": len(documents),
+                "chunk_count": chunk_count,
+                "chunk_size": chunk_size
+            }
+        }
+    
+    async def chunk_batch(self, texts: List[str], chunk_size: int,
+                          extract_entities: bool = False) -> List[Tuple[int, int, List[str], List[Dict[str, str]]]]:
+        """Count, chunk and (optionally) extract entities for many documents
+
+        Large batches are spread over the shared worker processes, one document per
+        task; small ones are processed inline, where starting workers would cost more
+        than the work itself. Results are in the order of texts.
+        """
+        if sum(len(text) for text in texts) < _OFFLOAD_MIN_CHARS:
+            return [_process_text(text, chunk_size, extract_entities) for text in texts]
+        
+        loop = asyncio.get_running_loop()
+        pool = _process_pool()
+        return list(await asyncio.gather(*(
+            loop.run_in_executor(pool, _process_text, text, chunk_size, extract_entities) for text in texts
+        )))
+    
+    @staticmethod
+    def _document_result(text: str, processed: Tuple[int, int, List[str], List[Dict[str, str]]], chunk_size: int,
+                         compact_output: bool) -> Dict[str, Any]:
+        """Output for one processed document"""
+        word_count, paragraph_count, chunks, entities = processed
+        result = {}
+        if not compact_output:
+            # processed_text is a second full copy of the document; compact output leaves
+            # it (and the caller's own text) out for consumers that only read the chunks
+            result["original_text"] = text
+            result["processed_text"] = "\n\n".join(chunks)
+        result["chunks"] = chunks
+        result["metadata"] = {
+            "word_count": word_count,
+            "char_count": len(text),
+            "paragraph_count": paragraph_count,
+            "chunk_count": len(chunks),
+            "chunk_size": chunk_size,
+            "entities": entities
+        }
+        return result
+    
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate document node configuration"""
         # Must have either text in config or expect input data
@@ -82,57 +213,63 @@ class DocumentExecutor(BaseNodeExecutor):
         if has_chunk_size and config["chunk_size"] > 10000:
             return False  # Chunk size too large
         
+        batch_texts = config.get("batch_texts")
+        if batch_texts is not None and not (
+            isinstance(batch_texts, list) and all(isinstance(text, str) for text in batch_texts)
+        ):
+            return False
+        
         return True  # Allow nodes without text (they'll get input data)
     
-    def _chunk_text(self, text: str, chunk_size: int) -> List[str]:
-        """Split text into chunks"""
-        words = text.split()
+    @staticmethod
+    def _chunk_text(text: str, chunk_size: int, spans: Optional[List[Tuple[int, int]]] = None) -> List[str]:
+        """Split text into chunks of whole words, sliced straight out of the text"""
+        if spans is None:
+            spans = [match.span() for match in _WORD_RE.finditer(text)]
+        # Word end offsets are increasing, so each chunk boundary is a binary search
+        ends = [end for _, end in spans]
         chunks = []
-        current_chunk = []
-        current_size = 0
-        
-        for word in words:
-            word_size = len(word) + 1  # +1 for space
-            
-            if current_size + word_size > chunk_size and current_chunk:
-                # Create chunk and start new one
-                chunks.append(" ".join(current_chunk))
-                current_chunk = [word]
-                current_size = word_size
-            else:
-                current_chunk.append(word)
-                current_size += word_size
-        
-        # Add the last chunk
-        if current_chunk:
-            chunks.append(" ".join(current_chunk))
+        start = 0
+        
+        while start < len(spans):
+            chunk_start = spans[start][0]
+            # Fits if the slice plus a trailing separator stays within chunk_size
+            end = bisect_right(ends, chunk_start + chunk_size - 1, start)
+            if end == start:
+                # A word longer than chunk_size gets a chunk of its own
+                end = start + 1
+            chunks.append(text[chunk_start:ends[end - 1]])
+            start = end
         
         return chunks
     
-    def _extract_simple_entities(self, text: str) -> List[Dict[str, str]]:
+    @staticmethod
+    def _extract_simple_entities(text: str) -> List[Dict[str, str]]:
         """Extract simple entities using regex patterns"""
         entities = []
         
         # Email addresses
-        emails = re.findall(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', text)
+        emails = _EMAIL_RE.findall(text)
         for email in emails:
             entities.append({"type": "email", "value": email})
         
         # URLs
-        urls = re.findall(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', text)
+        urls = _URL_RE.findall(text)
         for url in urls:
             entities.append({"type": "url", "value": url})
         
         # Phone numbers (simple pattern)
-        phones = re.findall(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b', text)
+        phones = _PHONE_RE.findall(text)
         for phone in phones:
             entities.append({"type": "phone", "value": phone})
         
         # Capitalized words (potential names/places)
-        capitalized = re.findall(r'\b[A-Z][a-z]+\b', text)
+        capitalized = _CAPITALIZED_RE.findall(text)
         # Only include if they appear multiple times or are common name patterns
-        for word in set(capitalized):
-            if text.count(word) > 1 or len(word) > 2:
+        for word, count in Counter(capitalized).items():
+            if len(entities) >= 50:
+                break
+            if count > 1 or len(word) > 2:
                 entities.append({"type": "proper_noun", "value": word})
         
         return entities[:50]  # Limit to 50 entities
@@ -140,13 +277,5 @@ class DocumentExecutor(BaseNodeExecutor):
     def get_required_inputs(self) -> List[str]:
         return []  # Can work with or without input
     
-    def get_output_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "original_text": {"type": "string"},
-                "processed_text": {"type": "string"},
-                "chunks": {"type": "array", "items": {"type": "string"}},
-                "metadata": {"type": "object"}
-            }
-        } 
\ No newline at end of file
+    def get_output_schema(self) -> Mapping[str, Any]:
+        return self._OUTPUT_SCHEMA 
\ No newline at end of file
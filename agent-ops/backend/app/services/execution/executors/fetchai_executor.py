@@ -3,14 +3,43 @@ Fetch AI Agent Marketplace executor for browsing and deploying autonomous agents
 """
 import asyncio
 import httpx
-from typing import Any, Dict, List, Optional
-from ..base_executor import BaseNodeExecutor, ExecutionContext
+from typing import Any, Dict, List, Mapping, Optional
+from ..base_executor import BaseNodeExecutor, ExecutionContext, frozen_schema
 from ....models.workflow_models import WorkflowNode, LogLevel
 
 
 class FetchAIExecutor(BaseNodeExecutor):
     """Executor for Fetch AI Agent Marketplace nodes"""
     
+    _OUTPUT_SCHEMA: Mapping[str, Any] = frozen_schema({
+        "type": "object",
+        "properties": {
+            "success": {"type": "boolean", "description": "Whether deployment was successful"},
+            "deployed_agents": {
+                "type": "array",
+                "description": "List of deployed agents",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "agent_id": {"type": "string"},
+                        "name": {"type": "string"},
+                        "status": {"type": "string"},
+                        "deployment_id": {"type": "string"},
+                        "network_address": {"type": "string"},
+                        "cost": {"type": "number"},
+                        "capabilities": {"type": "array", "items": {"type": "string"}}
+                    }
+                }
+            },
+            "total_cost": {"type": "number", "description": "Total deployment cost"},
+            "deployment_time": {"type": "string", "description": "Time taken for deployment"},
+            "network": {"type": "string", "description": "Network where agents are deployed"},
+            "status": {"type": "string", "description": "Overall deployment status"},
+            "message": {"type": "string", "description": "Status message"}
+        },
+        "required": ["success", "deployed_agents", "total_cost", "status"]
+    })
+    
     def __init__(self):
         super().__init__()
         self.marketplace_endpoint = "https://api.fetch.ai/v1/agents"
@@ -25,6 +54,8 @@ class FetchAIExecutor(BaseNodeExecutor):
         
         # Get configuration
         selected_agents = config.get('selectedAgents', [])
+        # Simulated per-agent deployment time, off unless configured
+        delay = config.get('mock_delay_s', 0.0)
         
         if not selected_agents:
             context.log(LogLevel.WARNING, "No agents selected for deployment", node_id)
@@ -37,7 +68,7 @@ class FetchAIExecutor(BaseNodeExecutor):
         
         try:
             # Deploy agents to Fetch.ai network
-            response = await self._deploy_agents(selected_agents, context, node_id)
+            response = await self._deploy_agents(selected_agents, context, node_id, delay)
             
             context.log(LogLevel.INFO, f"Agent deployment completed", node_id, {
                 "deployed_agents": len(response["deployed_agents"]),
@@ -50,40 +81,48 @@ class FetchAIExecutor(BaseNodeExecutor):
             context.log(LogLevel.ERROR, f"Agent deployment failed: {str(e)}", node_id)
             # Fall back to mock deployment on error
             context.log(LogLevel.INFO, "Falling back to mock deployment due to API error", node_id)
-            return await self._get_mock_deployment_response(selected_agents, context, node_id)
+            return await self._get_mock_deployment_response(selected_agents, context, node_id, delay)
     
-    async def _deploy_agents(self, selected_agents: List[Dict[str, Any]], context: ExecutionContext, node_id: str) -> Dict[str, Any]:
+    async def _deploy_agents(self, selected_agents: List[Dict[str, Any]], context: ExecutionContext, node_id: str,
+                             delay: float = 0.0) -> Dict[str, Any]:
         """Deploy selected agents to Fetch.ai network"""
-        # Simulate real deployment process
-        await asyncio.sleep(1.0)  # Simulate deployment time
-        
-        deployed_agents = []
-        total_cost = 0
-        
-        for agent in selected_agents:
-            deployment_result = {
-                "agent_id": agent.get('id'),
-                "name": agent.get('name'),
-                "status": "deployed",
-                "deployment_id": f"deploy_{agent.get('id')}_{int(asyncio.get_event_loop().time())}",
-                "network_address": f"fetch://agents/{agent.get('id')}",
-                "cost": agent.get('price', 0)
-            }
-            
-            deployed_agents.append(deployment_result)
-            total_cost += agent.get('price', 0)
-            
-            context.log(LogLevel.DEBUG, f"Deployed agent: {agent.get('name')}", node_id)
+        # Agents deploy independently, so deploy them concurrently
+        debug = context.is_enabled(LogLevel.DEBUG)
+        deployed_agents = await asyncio.gather(
+            *(self._deploy_agent(agent, context, node_id, debug, delay) for agent in selected_agents)
+        )
+        total_cost = sum(result["cost"] for result in deployed_agents)
         
         return {
             "success": True,
-            "deployed_agents": deployed_agents,
+            "deployed_agents": list(deployed_agents),
             "total_cost": total_cost,
-            "deployment_time": "1.0s",
+            "deployment_time": f"{delay}s",
             "network": "fetch.ai",
             "status": "completed"
         }
     
+    async def _deploy_agent(self, agent: Dict[str, Any], context: ExecutionContext, node_id: str, debug: bool,
+                            delay: float) -> Dict[str, Any]:
+        """Deploy a single agent to Fetch.ai network"""
+        # Simulate real deployment process
+        if delay:
+            await asyncio.sleep(delay)  # Simulate deployment time
+        
+        deployment_result = {
+            "agent_id": agent.get('id'),
+            "name": agent.get('name'),
+            "status": "deployed",
+            "deployment_id": f"deploy_{agent.get('id')}_{int(asyncio.get_event_loop().time())}",
+            "network_address": f"fetch://agents/{agent.get('id')}",
+            "cost": agent.get('price', 0)
+        }
+        
+        if debug:
+            context.log(LogLevel.DEBUG, f"Deployed agent: {agent.get('name')}", node_id)
+        
+        return deployment_result
+    
     async def _get_empty_deployment_response(self, context: ExecutionContext, node_id: str) -> Dict[str, Any]:
         """Generate response when no agents are selected"""
         context.log(LogLevel.INFO, "No agents to deploy", node_id)
@@ -97,44 +136,50 @@ class FetchAIExecutor(BaseNodeExecutor):
         }
     
     async def _get_mock_deployment_response(self, selected_agents: List[Dict[str, Any]], 
-                                          context: ExecutionContext, node_id: str) -> Dict[str, Any]:
+                                          context: ExecutionContext, node_id: str, delay: float = 0.0) -> Dict[str, Any]:
         """Generate mock deployment response for testing"""
-        # Simulate deployment time
-        await asyncio.sleep(1.0)
-        
-        deployed_agents = []
-        total_cost = 0
-        
-        for agent in selected_agents:
-            deployment_result = {
-                "agent_id": agent.get('id'),
-                "name": agent.get('name'),
-                "status": "deployed",
-                "deployment_id": f"mock_deploy_{agent.get('id')}",
-                "network_address": f"fetch://agents/mock/{agent.get('id')}",
-                "cost": agent.get('price', 0),
-                "capabilities": agent.get('capabilities', []),
-                "test_mode": True
-            }
-            
-            deployed_agents.append(deployment_result)
-            total_cost += agent.get('price', 0)
-            
-            context.log(LogLevel.DEBUG, f"Mock deployed agent: {agent.get('name')}", node_id)
+        debug = context.is_enabled(LogLevel.DEBUG)
+        deployed_agents = await asyncio.gather(
+            *(self._mock_deploy_agent(agent, context, node_id, debug, delay) for agent in selected_agents)
+        )
+        total_cost = sum(result["cost"] for result in deployed_agents)
         
         context.log(LogLevel.INFO, f"Mock deployment completed for {len(deployed_agents)} agents", node_id)
         
         return {
             "success": True,
-            "deployed_agents": deployed_agents,
+            "deployed_agents": list(deployed_agents),
             "total_cost": total_cost,
-            "deployment_time": "1.0s",
+            "deployment_time": f"{delay}s",
             "network": "fetch.ai (test mode)",
             "status": "completed",
             "test_mode": True,
             "message": f"Successfully deployed {len(deployed_agents)} agents to test network"
         }
     
+    async def _mock_deploy_agent(self, agent: Dict[str, Any], context: ExecutionContext, node_id: str, debug: bool,
+                                 delay: float) -> Dict[str, Any]:
+        """Mock deployment of a single agent"""
+        # Simulate deployment time
+        if delay:
+            await asyncio.sleep(delay)
+        
+        deployment_result = {
+            "agent_id": agent.get('id'),
+            "name": agent.get('name'),
+            "status": "deployed",
+            "deployment_id": f"mock_deploy_{agent.get('id')}",
+            "network_address": f"fetch://agents/mock/{agent.get('id')}",
+            "cost": agent.get('price', 0),
+            "capabilities": agent.get('capabilities', []),
+            "test_mode": True
+        }
+        
+        if debug:
+            context.log(LogLevel.DEBUG, f"Mock deployed agent: {agent.get('name')}", node_id)
+        
+        return deployment_result
+    
 
     
     def validate_config(self, config: Dict[str, Any]) -> bool:
@@ -165,33 +210,6 @@ class FetchAIExecutor(BaseNodeExecutor):
         """Get list of required inputs for this executor"""
         return []  # No required inputs, can work standalone
     
-    def get_output_schema(self) -> Dict[str, Any]:
+    def get_output_schema(self) -> Mapping[str, Any]:
         """Get the output schema for this executor"""
-        return {
-            "type": "object",
-            "properties": {
-                "success": {"type": "boolean", "description": "Whether deployment was successful"},
-                "deployed_agents": {
-                    "type": "array",
-                    "description": "List of deployed agents",
-                    "items": {
-                        "type": "object",
-                        "properties": {
-                            "agent_id": {"type": "string"},
-                            "name": {"type": "string"},
-                            "status": {"type": "string"},
-                            "deployment_id": {"type": "string"},
-                            "network_address": {"type": "string"},
-                            "cost": {"type": "number"},
-                            "capabilities": {"type": "array", "items": {"type": "string"}}
-                        }
-                    }
-                },
-                "total_cost": {"type": "number", "description": "Total deployment cost"},
-                "deployment_time": {"type": "string", "description": "Time taken for deployment"},
-                "network": {"type": "string", "description": "Network where agents are deployed"},
-                "status": {"type": "string", "description": "Overall deployment status"},
-                "message": {"type": "string", "description": "Status message"}
-            },
-            "required": ["success", "deployed_agents", "total_cost", "status"]
-        } 
\ No newline at end of file
+        return self._OUTPUT_SCHEMA 
\ No newline at end of file
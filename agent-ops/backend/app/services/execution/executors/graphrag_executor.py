@@ -252,7 +252,8 @@ class GraphRAGExecutor(BaseNodeExecutor):
         context.log(LogLevel.INFO, f"Generated Cypher query: {cypher_query}", node_id)
         
         try:
-            result = await neo4j_service.execute_query(node_id, cypher_query)
+            max_results = config.get("max_results", 1000)
+            result = await neo4j_service.execute_query(node_id, cypher_query, max_records=max_results)
             
             if result.success:
                 context.log(LogLevel.INFO, f"Database query successful, {len(result.data)} results returned", node_id)
@@ -260,8 +261,9 @@ class GraphRAGExecutor(BaseNodeExecutor):
                 
                 # Log sample results for debugging
                 if result.data:
-                    sample_results = result.data[:3]  # First 3 results
-                    context.log(LogLevel.DEBUG, f"Sample results: {sample_results}", node_id)
+                    if context.is_enabled(LogLevel.DEBUG):
+                        sample_results = result.data[:3]  # First 3 results
+                        context.log(LogLevel.DEBUG, f"Sample results: {sample_results}", node_id)
                 else:
                     context.log(LogLevel.WARNING, f"Query returned no results", node_id)
                 
@@ -274,6 +276,7 @@ class GraphRAGExecutor(BaseNodeExecutor):
                     "metadata": {
                         "database_connected": True,
                         "result_count": len(result.data),
+                        "result_limit_reached": result.truncated,
                         "query_type": self._classify_query_type(query),
                         "input_data_type": str(type(input_data).__name__)
                     }
@@ -509,43 +512,42 @@ class GraphRAGExecutor(BaseNodeExecutor):
         context.log(LogLevel.INFO, f"Analyzing database", node_id)
         
         try:
-            # Get database statistics
-            stats_result = await neo4j_service.get_database_stats(node_id)
+            # Statistics and both distributions are independent reads, so run them concurrently
+            results = await asyncio.gather(
+                neo4j_service.get_database_stats(node_id),
+                # Entity distribution (one query for all labels)
+                self._fetch_distribution(node_id, """
+                    MATCH (n)
+                    UNWIND labels(n) AS label
+                    RETURN label, count(*) as count
+                """, "label"),
+                # Relationship distribution
+                self._fetch_distribution(node_id, """
+                    MATCH ()-[r]->()
+                    RETURN type(r) as relationship, count(r) as count
+                    ORDER BY count DESC
+                    LIMIT 10
+                """, "relationship"),
+                return_exceptions=True
+            )
+            for outcome in results:
+                if isinstance(outcome, Exception):
+                    raise outcome
+            stats_result, entity_distribution, relationship_distribution = results
             
             if not stats_result.success:
                 raise Exception(stats_result.message)
             
             stats = stats_result.stats
             
-            # Get sample data for analysis
-            driver = neo4j_service.drivers.get(node_id)
             analysis = {
                 "total_nodes": stats.nodes,
                 "total_relationships": stats.relationships,
                 "labels": stats.labels,
-                "entity_distribution": {},
-                "relationship_distribution": {}
+                "entity_distribution": entity_distribution,
+                "relationship_distribution": relationship_distribution
             }
             
-            if driver:
-                with driver.session() as session:
-                    # Get entity distribution
-                    for label in stats.labels:
-                        result = session.run(f"MATCH (n:{label}) RETURN count(n) as count")
-                        record = result.single()
-                        if record:
-                            analysis["entity_distribution"][label] = record["count"]
-                    
-                    # Get relationship distribution
-                    result = session.run("""
-                        MATCH ()-[r]->()
-                        RETURN type(r) as relationship, count(r) as count
-                        ORDER BY count DESC
-                        LIMIT 10
-                    """)
-                    for record in result:
-                        analysis["relationship_distribution"][record["relationship"]] = record["count"]
-            
             context.log(LogLevel.INFO, f"Analysis complete", node_id)
             
             return {
@@ -560,6 +562,16 @@ class GraphRAGExecutor(BaseNodeExecutor):
             context.log(LogLevel.ERROR, f"Database analysis failed: {str(e)}", node_id)
             raise
     
+    async def _fetch_distribution(self, node_id: str, query: str, key: str) -> Dict[str, int]:
+        """Run a (key, count) aggregation in its own session and collect it into a dict"""
+        session = neo4j_service.get_session(node_id)
+        if not session:
+            return {}
+        
+        async with session:
+            result = await session.run(query)
+            return {record[key]: record["count"] async for record in result}
+    
     def _extract_text_from_input(self, input_data: Any) -> str:
         """Extract text from various input formats"""
         if isinstance(input_data, str):
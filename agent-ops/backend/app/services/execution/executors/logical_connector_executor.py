@@ -1,9 +1,11 @@
 """
 Logical Connector node executor for AND/OR operations
 """
-from typing import Any, Dict, List, Union
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Union
 from enum import Enum
-from ..base_executor import BaseNodeExecutor, ExecutionContext
+from ..base_executor import BaseNodeExecutor, ExecutionContext, frozen_schema
 from ....models.workflow_models import WorkflowNode, LogLevel
 
 
@@ -12,15 +14,68 @@ class LogicalOperation(str, Enum):
     OR = "or"
 
 
+# Common falsy string values
+_FALSY_STRINGS = frozenset({'false', 'no', 'off', '0', 'null', 'undefined', 'none', ''})
+
+
+# Only short strings are cached: the falsy tokens are tiny, and longer inputs are
+# usually whole LLM or document outputs that should not be pinned in memory
+_CACHED_STR_MAX_LEN = 16
+
+
+def _str_is_truthy(value: str) -> bool:
+    return value.lower().strip() not in _FALSY_STRINGS
+
+
+# Fan-in graphs feed the same strings ("true", "yes", ...) through many connectors
+_short_str_truthy = lru_cache(maxsize=1024)(_str_is_truthy)
+
+
+def _str_truthy(value: str) -> bool:
+    if len(value) <= _CACHED_STR_MAX_LEN:
+        return _short_str_truthy(value)
+    return _str_is_truthy(value)
+
+
+# Truthiness for the common exact input types, looked up once instead of walking the checks in _is_truthy
+_TRUTHY_BY_TYPE = MappingProxyType({
+    type(None): lambda value: False,
+    bool: bool,
+    int: bool,
+    float: bool,
+    str: _str_truthy,
+    list: bool,
+    tuple: bool,
+    set: bool,
+    dict: bool,
+})
+
+
 class LogicalConnectorExecutor(BaseNodeExecutor):
     """Executor for logical connector nodes that perform AND/OR operations"""
     
+    _OUTPUT_SCHEMA: Mapping[str, Any] = frozen_schema({
+        "type": "object",
+        "properties": {
+            "operation": {"type": "string", "enum": ["and", "or"]},
+            "inputs": {"type": "array"},
+            "result": {"type": "boolean"},
+            "input_count": {"type": "integer"},
+            "truthy_count": {"type": "integer"},
+            "falsy_count": {"type": "integer"}
+        },
+        "required": ["operation", "inputs", "result"]
+    })
+    
+    is_deterministic = True
+    
     async def _execute_impl(self, node: WorkflowNode, context: ExecutionContext, input_data: Any) -> Any:
         config = node.config
         operation = config.get("operation", LogicalOperation.AND).lower()
         
         context.log(LogLevel.INFO, f"Executing logical {operation.upper()} operation", node.id)
-        context.log(LogLevel.DEBUG, f"Input data type: {type(input_data)}", node.id)
+        if context.is_enabled(LogLevel.DEBUG):
+            context.log(LogLevel.DEBUG, f"Input data type: {type(input_data)}", node.id)
         
         # Handle different input types
         inputs = self._extract_inputs(input_data, context, node.id)
@@ -34,24 +89,28 @@ class LogicalConnectorExecutor(BaseNodeExecutor):
                 "message": "No inputs provided"
             }
         
-        context.log(LogLevel.DEBUG, f"Processing {len(inputs)} inputs", node.id)
+        # One pass over the inputs gives both the counts and the result
+        truthy_count = sum(map(self._is_truthy, inputs))
         
         # Perform logical operation
         if operation == LogicalOperation.AND:
-            result = self._perform_and_operation(inputs, context, node.id)
+            result = truthy_count == len(inputs)
         elif operation == LogicalOperation.OR:
-            result = self._perform_or_operation(inputs, context, node.id)
+            result = truthy_count > 0
         else:
             raise ValueError(f"Unsupported logical operation: {operation}")
         
+        if context.is_enabled(LogLevel.DEBUG):
+            context.log(LogLevel.DEBUG, f"{operation.upper()} of {len(inputs)} inputs ({truthy_count} truthy) -> {result}", node.id)
+        
         # Create response
         output = {
             "operation": operation,
             "inputs": inputs,
             "result": result,
             "input_count": len(inputs),
-            "truthy_count": sum(1 for inp in inputs if self._is_truthy(inp)),
-            "falsy_count": sum(1 for inp in inputs if not self._is_truthy(inp))
+            "truthy_count": truthy_count,
+            "falsy_count": len(inputs) - truthy_count
         }
         
         context.log(LogLevel.INFO, f"Logical {operation.upper()} result: {result}", node.id, {
@@ -68,61 +127,34 @@ class LogicalConnectorExecutor(BaseNodeExecutor):
         if input_data is None:
             return inputs
         
+        debug = context.is_enabled(LogLevel.DEBUG)
+        
         # If input is a dictionary (multiple node outputs)
         if isinstance(input_data, dict):
-            context.log(LogLevel.DEBUG, f"Processing dictionary input with {len(input_data)} keys", node_id)
+            if debug:
+                context.log(LogLevel.DEBUG, f"Processing dictionary input with {len(input_data)} keys", node_id)
             inputs = list(input_data.values())
         
         # If input is a list
         elif isinstance(input_data, list):
-            context.log(LogLevel.DEBUG, f"Processing list input with {len(input_data)} items", node_id)
+            if debug:
+                context.log(LogLevel.DEBUG, f"Processing list input with {len(input_data)} items", node_id)
             inputs = input_data
         
         # Single input value
         else:
-            context.log(LogLevel.DEBUG, "Processing single input value", node_id)
+            if debug:
+                context.log(LogLevel.DEBUG, "Processing single input value", node_id)
             inputs = [input_data]
         
         return inputs
     
-    def _perform_and_operation(self, inputs: List[Any], context: ExecutionContext, node_id: str) -> bool:
-        """Perform logical AND operation on inputs"""
-        if not inputs:
-            return False
-        
-        result = True
-        for i, inp in enumerate(inputs):
-            is_truthy = self._is_truthy(inp)
-            context.log(LogLevel.DEBUG, f"Input {i+1}: {type(inp).__name__} -> {is_truthy}", node_id)
-            result = result and is_truthy
-            
-            # Short-circuit evaluation for AND
-            if not result:
-                context.log(LogLevel.DEBUG, f"AND operation short-circuited at input {i+1}", node_id)
-                break
-        
-        return result
-    
-    def _perform_or_operation(self, inputs: List[Any], context: ExecutionContext, node_id: str) -> bool:
-        """Perform logical OR operation on inputs"""
-        if not inputs:
-            return False
-        
-        result = False
-        for i, inp in enumerate(inputs):
-            is_truthy = self._is_truthy(inp)
-            context.log(LogLevel.DEBUG, f"Input {i+1}: {type(inp).__name__} -> {is_truthy}", node_id)
-            result = result or is_truthy
-            
-            # Short-circuit evaluation for OR
-            if result:
-                context.log(LogLevel.DEBUG, f"OR operation short-circuited at input {i+1}", node_id)
-                break
-        
-        return result
-    
     def _is_truthy(self, value: Any) -> bool:
         """Determine if a value is truthy using comprehensive logic"""
+        truthy = _TRUTHY_BY_TYPE.get(type(value))
+        if truthy is not None:
+            return truthy(value)
+        
         # Handle None
         if value is None:
             return False
@@ -137,12 +169,7 @@ class LogicalConnectorExecutor(BaseNodeExecutor):
         
         # Handle strings
         if isinstance(value, str):
-            # Empty string is falsy
-            if not value:
-                return False
-            # Common falsy string values
-            falsy_strings = {'false', 'no', 'off', '0', 'null', 'undefined', 'none', ''}
-            return value.lower().strip() not in falsy_strings
+            return _str_truthy(value)
         
         # Handle collections (lists, dicts, tuples, sets)
         if hasattr(value, '__len__'):
@@ -179,16 +206,5 @@ class LogicalConnectorExecutor(BaseNodeExecutor):
     def get_required_inputs(self) -> List[str]:
         return []  # Can work with any inputs
     
-    def get_output_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "operation": {"type": "string", "enum": ["and", "or"]},
-                "inputs": {"type": "array"},
-                "result": {"type": "boolean"},
-                "input_count": {"type": "integer"},
-                "truthy_count": {"type": "integer"},
-                "falsy_count": {"type": "integer"}
-            },
-            "required": ["operation", "inputs", "result"]
-        } 
\ No newline at end of file
+    def get_output_schema(self) -> Mapping[str, Any]:
+        return self._OUTPUT_SCHEMA 
\ No newline at end of file
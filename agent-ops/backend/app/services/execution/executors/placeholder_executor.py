@@ -2,70 +2,99 @@
 Placeholder executor for nodes not yet fully implemented
 """
 import asyncio
-from typing import Any, Dict, List
-from ..base_executor import BaseNodeExecutor, ExecutionContext
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+from ..base_executor import BaseNodeExecutor, ExecutionContext, frozen_schema
 from ....models.workflow_models import WorkflowNode, LogLevel
 
+try:
+    # Optional: embeddings nodes with "return_numpy" get float32-rounded values
+    import numpy as np
+except ImportError:
+    np = None
+
+# Mock embeddings (normally would be 1536 dimensions for OpenAI), shared by every call
+_MOCK_EMBEDDINGS = (0.1,) * 1536
+_MOCK_EMBEDDINGS_F32 = None
+if np is not None:
+    # Converted back to Python floats so results stay JSON-serializable
+    _MOCK_EMBEDDINGS_F32 = tuple(np.full(len(_MOCK_EMBEDDINGS), 0.1, dtype=np.float32).tolist())
+
+# Mock responses by node type: (input field, default when the input is not a string,
+# builder returning a fresh response body). A default of None passes the input data through as-is.
+# Bodies are built per call rather than copied from a shared template; the embeddings are
+# immutable and shared as-is.
+_MOCK_RESPONSES: Dict[str, Tuple[str, Optional[str], Callable[[], Dict[str, Any]]]] = {
+    "search": ("query", "placeholder query", lambda: {
+        "results": [
+            {"title": "Mock Search Result 1", "url": "https://example.com/1", "snippet": "This is a placeholder search result."},
+            {"title": "Mock Search Result 2", "url": "https://example.com/2", "snippet": "Another placeholder result."}
+        ],
+        "metadata": {"total_results": 2, "search_time": 0.5}
+    }),
+    "image": ("prompt", "placeholder prompt", lambda: {
+        "image_url": "https://via.placeholder.com/512x512.png?text=Generated+Image",
+        "metadata": {"width": 512, "height": 512, "format": "PNG"}
+    }),
+    "embeddings": ("text", "placeholder text", lambda: {
+        "embeddings": _MOCK_EMBEDDINGS,
+        "metadata": {"dimensions": len(_MOCK_EMBEDDINGS), "model": "text-embedding-ada-002"}
+    }),
+    "api": ("request", None, lambda: {
+        "response": {"status": "success", "data": "Mock API response"},
+        "metadata": {"status_code": 200, "response_time": 0.5}
+    }),
+    "vapi": ("transcription", "Mock transcription", lambda: {
+        "audio_input": "Mock audio input",
+        "metadata": {"duration": 5.0, "language": "en"}
+    }),
+    "graphrag": ("query", "placeholder query", lambda: {
+        "graph_results": [],
+        "metadata": {"nodes_found": 0, "relationships_found": 0}
+    }),
+}
+
 
 class PlaceholderExecutor(BaseNodeExecutor):
     """Placeholder executor for nodes that don't have full implementation yet"""
     
+    _OUTPUT_SCHEMA: Mapping[str, Any] = frozen_schema({
+        "type": "object",
+        "properties": {
+            "input": {"type": "any"},
+            "output": {"type": "any"},
+            "metadata": {"type": "object"}
+        }
+    })
+    
     def __init__(self, node_type: str):
         super().__init__()
         self.node_type = node_type
+        # Executors are cached per node type, so resolve the mock response once
+        self._mock_response = _MOCK_RESPONSES.get(node_type)
     
     async def _execute_impl(self, node: WorkflowNode, context: ExecutionContext, input_data: Any) -> Any:
         context.log(LogLevel.INFO, f"Executing placeholder for {self.node_type} node", node.id)
         context.log(LogLevel.WARNING, f"This is a placeholder - {self.node_type} executor not yet implemented", node.id)
         
-        # Simulate some processing time
-        await asyncio.sleep(0.5)
+        # Simulated processing time is opt-in, so placeholders don't slow down real workflows
+        delay = node.config.get("mock_delay_s", 0.0)
+        if delay:
+            await asyncio.sleep(delay)
         
         # Create a mock response based on node type
-        if self.node_type == "search":
-            result = {
-                "query": input_data if isinstance(input_data, str) else "placeholder query",
-                "results": [
-                    {"title": "Mock Search Result 1", "url": "https://example.com/1", "snippet": "This is a placeholder search result."},
-                    {"title": "Mock Search Result 2", "url": "https://example.com/2", "snippet": "Another placeholder result."}
-                ],
-                "metadata": {"total_results": 2, "search_time": 0.5}
-            }
-        elif self.node_type == "image":
-            result = {
-                "prompt": input_data if isinstance(input_data, str) else "placeholder prompt",
-                "image_url": "https://via.placeholder.com/512x512.png?text=Generated+Image",
-                "metadata": {"width": 512, "height": 512, "format": "PNG"}
-            }
-        elif self.node_type == "embeddings":
-            text = input_data if isinstance(input_data, str) else "placeholder text"
-            # Generate mock embeddings (normally would be 1536 dimensions for OpenAI)
-            mock_embeddings = [0.1] * 1536
-            result = {
-                "text": text,
-                "embeddings": mock_embeddings,
-                "metadata": {"dimensions": len(mock_embeddings), "model": "text-embedding-ada-002"}
-            }
-        elif self.node_type == "api":
-            result = {
-                "request": input_data,
-                "response": {"status": "success", "data": "Mock API response"},
-                "metadata": {"status_code": 200, "response_time": 0.5}
-            }
-        elif self.node_type == "vapi":
-            result = {
-                "audio_input": "Mock audio input",
-                "transcription": input_data if isinstance(input_data, str) else "Mock transcription",
-                "metadata": {"duration": 5.0, "language": "en"}
-            }
-        elif self.node_type == "graphrag":
-            # This is special - let it use the real GraphRAG functionality if available
-            context.log(LogLevel.INFO, "GraphRAG node detected - should use real implementation", node.id)
-            result = {
-                "query": input_data if isinstance(input_data, str) else "placeholder query",
-                "graph_results": [],
-                "metadata": {"nodes_found": 0, "relationships_found": 0}
-            }
+        mock = self._mock_response
+        if mock is not None:
+            if self.node_type == "graphrag":
+                # This is special - let it use the real GraphRAG functionality if available
+                context.log(LogLevel.INFO, "GraphRAG node detected - should use real implementation", node.id)
+            field, default, build_response = mock
+            value = input_data if default is None or isinstance(input_data, str) else default
+            result = {field: value, **build_response()}
+            if self.node_type == "embeddings" and node.config.get("return_numpy"):
+                if _MOCK_EMBEDDINGS_F32 is not None:
+                    result["embeddings"] = _MOCK_EMBEDDINGS_F32
+                else:
+                    context.log(LogLevel.WARNING, "return_numpy requested but numpy is not installed", node.id)
         else:
             # Generic placeholder
             result = {
@@ -88,12 +117,5 @@ class PlaceholderExecutor(BaseNodeExecutor):
     def get_required_inputs(self) -> List[str]:
         return []  # No specific requirements for placeholder
     
-    def get_output_schema(self) -> Dict[str, Any]:
-        return {
-            "type": "object",
-            "properties": {
-                "input": {"type": "any"},
-                "output": {"type": "any"},
-                "metadata": {"type": "object"}
-            }
-        } 
\ No newline at end of file
+    def get_output_schema(self) -> Mapping[str, Any]:
+        return self._OUTPUT_SCHEMA 
\ No newline at end of file
@@ -1,16 +1,29 @@
 """
 Search node executor for web search and internal document search
 """
-from typing import Any, Dict, List
+import heapq
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import re
 import json
 from ..base_executor import BaseNodeExecutor, ExecutionContext
 from ....models.workflow_models import WorkflowNode, LogLevel
 
+try:
+    # Aho-Corasick finds every term of a multi-term query in one pass over a document
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 class SearchExecutor(BaseNodeExecutor):
     """Executor for search nodes supporting web search and document search"""
     
+    def is_deterministic_for(self, config: Dict[str, Any]) -> bool:
+        # Document search is a pure function of its input; web results change over time
+        return config.get("search_type", "web") == "document"
+    
     async def _execute_impl(self, node: WorkflowNode, context: ExecutionContext, input_data: Any) -> Any:
         config = node.config
         
@@ -45,6 +58,8 @@ class SearchExecutor(BaseNodeExecutor):
         
         # Mock web search results - in a real implementation, this would call
         # search APIs like Google Custom Search, Bing API, DuckDuckGo, etc.
+        # Results are not cached: building the mock is cheaper than a lookup, and a
+        # real provider's cache needs to be keyed on the whole config, not just the query
         mock_results = [
             {
                 "title": f"Search Result 1 for '{query}'",
@@ -114,49 +129,58 @@ class SearchExecutor(BaseNodeExecutor):
                 "metadata": {"message": "No documents available for search"}
             }
         
-        # Perform simple text search
+        # Perform simple text search: the whole query as one phrase, or with "match_terms": true
+        # each whitespace-separated term of the query on its own
         search_results = []
-        query_lower = query.lower()
+        terms = self._query_terms(query) if config.get("match_terms", False) else {}
+        if not terms:
+            terms = {query.lower(): query}
+        automaton = self._build_automaton(terms) if len(terms) > 1 and ahocorasick is not None else None
         
         for doc in documents:
             doc_id = doc.get("id", "unknown")
             content = doc.get("content", "")
             
-            if query_lower in content.lower():
-                # Find all matches and their context
-                matches = []
-                content_lower = content.lower()
-                start = 0
+            # Lowercase once; the find loops already handle documents without a match
+            content_lower = content.lower()
+            # Context is only kept for the first 3 matches per document; the rest are just counted
+            matches = []
+            found = self._iter_matches(content_lower, terms, automaton)
+            
+            for pos, term in islice(found, 3):
+                # Extract context around the match (50 chars before and after)
+                context_start = max(0, pos - 50)
+                context_end = min(len(content), pos + len(term) + 50)
+                context_text = content[context_start:context_end]
+                match_end = pos + len(term)
                 
-                while True:
-                    pos = content_lower.find(query_lower, start)
-                    if pos == -1:
-                        break
-                    
-                    # Extract context around the match (50 chars before and after)
-                    context_start = max(0, pos - 50)
-                    context_end = min(len(content), pos + len(query) + 50)
-                    context_text = content[context_start:context_end]
-                    
-                    matches.append({
-                        "position": pos,
-                        "context": context_text,
-                        "highlighted": context_text.replace(query, f"**{query}**")
-                    })
-                    
-                    start = pos + 1
+                matches.append({
+                    "position": pos,
+                    "context": context_text,
+                    # Built from the match offsets, so the match keeps the document's casing
+                    "highlighted": f"{content[context_start:pos]}**{content[pos:match_end]}**{content[match_end:context_end]}"
+                })
+            
+            if matches:
+                matches_count = len(matches)
+                if matches_count == 3:
+                    if not any(self._self_overlaps(term_lower) for term_lower in terms):
+                        # No term can overlap itself, so per-term str.count gives the same total in C
+                        matches_count = sum(content_lower.count(term_lower) for term_lower in terms)
+                    else:
+                        matches_count += sum(1 for _ in found)
                 
-                if matches:
-                    search_results.append({
-                        "document_id": doc_id,
-                        "matches_count": len(matches),
-                        "matches": matches[:3],  # Limit to first 3 matches per document
-                        "relevance_score": len(matches) / max(1, len(content.split()))
-                    })
+                search_results.append({
+                    "document_id": doc_id,
+                    "matches_count": matches_count,
+                    "matches": matches,
+                    # Match density; word counts are only taken for documents that matched
+                    "relevance_score": matches_count / max(1, len(content.split()))
+                })
         
         # Sort by relevance and limit results
-        search_results.sort(key=lambda x: x["relevance_score"], reverse=True)
-        search_results = search_results[:max_results]
+        # nlargest keeps ties in document order, same as a stable reverse sort
+        search_results = heapq.nlargest(max_results, search_results, key=itemgetter("relevance_score"))
         
         context.log(LogLevel.INFO, f"Found {len(search_results)} documents with matches", node_id)
         
@@ -171,6 +195,70 @@ class SearchExecutor(BaseNodeExecutor):
             }
         }
     
+    @staticmethod
+    def _query_terms(query: str) -> Dict[str, str]:
+        """Distinct whitespace-separated query terms, lowercased, mapped to their first spelling in the query"""
+        terms = {}
+        for term in query.split():
+            terms.setdefault(term.lower(), term)
+        return terms
+    
+    @staticmethod
+    def _build_automaton(terms: Dict[str, str]) -> Any:
+        """Aho-Corasick automaton over the lowercased terms"""
+        automaton = ahocorasick.Automaton()
+        for term_lower, term in terms.items():
+            automaton.add_word(term_lower, (len(term_lower), term))
+        automaton.make_automaton()
+        return automaton
+    
+    @staticmethod
+    def _self_overlaps(term: str) -> bool:
+        """Whether two occurrences of term can overlap, i.e. some proper prefix is also a suffix"""
+        return any(term.startswith(term[-k:]) for k in range(1, len(term)))
+    
+    @staticmethod
+    def _find_all(content_lower: str, term_lower: str, term: str) -> Iterator[Tuple[int, str]]:
+        """(position, term) of every (possibly overlapping) occurrence of one term"""
+        start = 0
+        while True:
+            pos = content_lower.find(term_lower, start)
+            if pos == -1:
+                return
+            yield pos, term
+            start = pos + 1
+    
+    @staticmethod
+    def _iter_matches(content_lower: str, terms: Dict[str, str], automaton: Optional[Any]) -> Iterator[Tuple[int, str]]:
+        """(position, term) of every (possibly overlapping) occurrence of the terms, lazily, in document order"""
+        if len(terms) == 1:
+            (term_lower, term), = terms.items()
+            return SearchExecutor._find_all(content_lower, term_lower, term)
+        
+        if automaton is not None:
+            return SearchExecutor._iter_automaton(content_lower, automaton, max(map(len, terms)))
+        
+        # Each term's matches already come in document order, so merging them stays lazy
+        return heapq.merge(
+            *(SearchExecutor._find_all(content_lower, term_lower, term) for term_lower, term in terms.items()),
+            key=lambda match: (match[0], len(match[1]))
+        )
+    
+    @staticmethod
+    def _iter_automaton(content_lower: str, automaton: Any, max_term_len: int) -> Iterator[Tuple[int, str]]:
+        """Automaton matches reordered from end to start position, holding back only those that may still be overtaken"""
+        pending: List[Tuple[int, int, str]] = []
+        for end, (length, term) in automaton.iter(content_lower):
+            heapq.heappush(pending, (end - length + 1, len(term), term))
+            # Later matches end at or after this one, so none can start before end - max_term_len + 1
+            ready_before = end - max_term_len + 1
+            while pending and pending[0][0] < ready_before:
+                pos, _, term = heapq.heappop(pending)
+                yield pos, term
+        while pending:
+            pos, _, term = heapq.heappop(pending)
+            yield pos, term
+    
     def validate_config(self, config: Dict[str, Any]) -> bool:
         """Validate search node configuration"""
         search_type = config.get("search_type", "web")
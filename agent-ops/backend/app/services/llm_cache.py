@@ -0,0 +1,111 @@
+"""
+Response cache for AI completions, so repeated deterministic requests
+skip the provider round-trip and its token spend
+"""
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Protocol, Tuple
+
+import orjson
+
+from ..models import ApiProviderType, CompletionRequest, CompletionResponse, TokenCost, TokenUsage
+
+
+class CacheBackend(Protocol):
+    """Storage for cached completions (in-memory by default, e.g. Redis in a shared deployment)"""
+
+    def get(self, key: str) -> Optional[CompletionResponse]:
+        ...
+
+    def set(self, key: str, value: CompletionResponse, ttl: float) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """Bounded in-process LRU with per-entry expiry"""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, CompletionResponse]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[CompletionResponse]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: CompletionResponse, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class LLMCache:
+    """
+    Exact-match cache for completions. Only requests with temperature 0 are
+    cached, since sampled output is not expected to repeat.
+    """
+
+    def __init__(self, backend: Optional[CacheBackend] = None, ttl: float = 3600.0):
+        self.backend: CacheBackend = backend or MemoryCacheBackend()
+        self.ttl = ttl
+
+    @staticmethod
+    def cache_key(provider: ApiProviderType, request: CompletionRequest) -> str:
+        """SHA-256 over the fields that determine a completion (API keys excluded)"""
+        payload = orjson.dumps(
+            {
+                "provider": provider,
+                "model": request.model,
+                "messages": request.messages,
+                "temperature": request.temperature,
+                "max_tokens": request.max_tokens,
+            },
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    @staticmethod
+    def is_cacheable(request: CompletionRequest) -> bool:
+        """Whether a request's response may be served from / stored in the cache"""
+        return request.temperature == 0 and not request.stream
+
+    def get(self, provider: ApiProviderType, request: CompletionRequest) -> Optional[CompletionResponse]:
+        """Cached response for a request, marked as a hit with no tokens, cost or latency"""
+        cached = self.backend.get(self.cache_key(provider, request))
+        if cached is None:
+            return None
+        return cached.model_copy(
+            update={
+                "usage": TokenUsage(prompt_tokens=0, completion_tokens=0, total_tokens=0),
+                "cost": TokenCost(prompt_cost=0.0, completion_cost=0.0, total_cost=0.0),
+                "latency_ms": 0.0,
+                "cache_hit": True,
+            },
+            deep=True,
+        )
+
+    def set(self, provider: ApiProviderType, request: CompletionRequest, response: CompletionResponse) -> None:
+        """Store a provider response for a request"""
+        self.backend.set(self.cache_key(provider, request), response, self.ttl)
+
+    def clear(self) -> None:
+        """Drop all cached responses"""
+        self.backend.clear()
+
+
+# Global instance
+llm_cache = LLMCache()
@@ -63,7 +63,8 @@ class Neo4jService:
             if is_aura:
                 # For AuraDB, use minimal configuration to avoid routing issues
                 driver_config = {
-                    "max_connection_pool_size": 1,  # Reduced pool size for better reliability
+                    # Small pool so concurrent sessions (e.g. parallel analysis reads) reuse warm connections
+                    "max_connection_pool_size": settings.aura_max_connection_pool_size,
                     "connection_acquisition_timeout": 60.0,  # Longer timeout
                     "max_connection_lifetime": 3600,  # 1 hour lifetime
                 }
@@ -307,21 +308,17 @@ class Neo4jService:
         
         try:
             async with session:
-                # Get node count
-                node_result = await session.run("MATCH (n) RETURN count(n) as nodeCount")
-                node_record = await node_result.single()
-                node_count = node_record["nodeCount"] if node_record else 0
-                
-                # Get relationship count
-                rel_result = await session.run("MATCH ()-[r]->() RETURN count(r) as relCount")
-                rel_record = await rel_result.single()
-                rel_count = rel_record["relCount"] if rel_record else 0
-                
-                # Get all labels
-                label_result = await session.run("CALL db.labels()")
-                labels = []
-                async for record in label_result:
-                    labels.append(record["label"])
+                # Node count, relationship count and labels in one round trip
+                result = await session.run("""
+                    CALL { MATCH (n) RETURN count(n) AS nodeCount }
+                    CALL { MATCH ()-[r]->() RETURN count(r) AS relCount }
+                    CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels }
+                    RETURN nodeCount, relCount, labels
+                """)
+                record = await result.single()
+                node_count = record["nodeCount"] if record else 0
+                rel_count = record["relCount"] if record else 0
+                labels = list(record["labels"]) if record else []
                 
                 stats = DatabaseStats(
                     nodes=node_count,
@@ -341,9 +338,9 @@ class Neo4jService:
                 message=f"Failed to retrieve database statistics: {str(e)}"
             )
     
-    async def execute_query(self, node_id: str, query: str, parameters: Dict[str, Any] = None) -> QueryResponse:
+    async def execute_query(self, node_id: str, query: str, parameters: Dict[str, Any] = None, max_records: Optional[int] = None) -> QueryResponse:
         """
-        Execute a Cypher query on the database
+        Execute a Cypher query on the database, keeping at most max_records rows if given
         """
         session = self.get_session(node_id)
         if not session:
@@ -361,16 +358,25 @@ class Neo4jService:
             async with session:
                 result = await session.run(query, parameters)
                 records = []
+                truncated = False
                 async for record in result:
+                    if max_records is not None and len(records) >= max_records:
+                        truncated = True
+                        break
                     records.append(dict(record))
                 
                 execution_time = (time.time() - start_time) * 1000  # Convert to milliseconds
                 
+                message = "Query executed successfully"
+                if truncated:
+                    message += f" (truncated to {max_records} records)"
+                
                 return QueryResponse(
                     success=True,
-                    message="Query executed successfully",
+                    message=message,
                     data=records,
-                    execution_time_ms=execution_time
+                    execution_time_ms=execution_time,
+                    truncated=truncated
                 )
                 
         except ClientError as e:
@@ -398,18 +404,6 @@ class Neo4jService:
         
         try:
             async with session:
-                # Check if database has any data
-                count_result = await session.run("MATCH (n) RETURN count(n) as count")
-                count_record = await count_result.single()
-                node_count = count_record["count"] if count_record else 0
-                
-                if node_count == 0:
-                    return {
-                        "success": True,
-                        "message": "Database is empty",
-                        "data": GraphData(nodes=[], links=[])
-                    }
-                
                 # Get nodes with their properties
                 nodes_query = """
                 MATCH (n) 
@@ -418,11 +412,12 @@ class Neo4jService:
                 """
                 nodes_result = await session.run(nodes_query, {"limit": limit})
                 nodes = []
-                node_ids = set()
+                node_ids = []
                 
+                # Build the response models directly, in the same pass that reads each row
                 async for record in nodes_result:
                     node_id_val = record["id"]
-                    node_ids.add(node_id_val)
+                    node_ids.append(node_id_val)
                     
                     # Get the primary label and a display name
                     labels = record["labels"] or ["Node"]
@@ -436,37 +431,38 @@ class Neo4jService:
                         f"{labels[0]}_{node_id_val}"
                     )
                     
-                    nodes.append({
-                        "id": node_id_val,
-                        "label": str(display_name),
-                        "group": labels[0] if labels else "Node",
-                        "properties": properties
-                    })
+                    nodes.append(GraphNode(
+                        id=node_id_val,
+                        label=str(display_name),
+                        group=labels[0],
+                        properties=properties
+                    ))
+                
+                if not nodes:
+                    return {
+                        "success": True,
+                        "message": "Database is empty",
+                        "data": GraphData(nodes=[], links=[])
+                    }
                 
                 # Get relationships between the nodes we fetched
-                if node_ids:
-                    rel_query = """
-                    MATCH (a)-[r]->(b)
-                    WHERE id(a) IN $node_ids AND id(b) IN $node_ids
-                    RETURN id(a) as source, id(b) as target, type(r) as type, properties(r) as properties
-                    """
-                    rel_result = await session.run(rel_query, {"node_ids": list(node_ids)})
-                    links = []
-                    
-                    async for record in rel_result:
-                        links.append({
-                            "source": record["source"],
-                            "target": record["target"],
-                            "type": record["type"] or "RELATED_TO",
-                            "properties": record["properties"] or {}
-                        })
-                else:
-                    links = []
+                rel_query = """
+                MATCH (a)-[r]->(b)
+                WHERE id(a) IN $node_ids AND id(b) IN $node_ids
+                RETURN id(a) as source, id(b) as target, type(r) as type, properties(r) as properties
+                """
+                rel_result = await session.run(rel_query, {"node_ids": node_ids})
+                links = []
                 
-                graph_data = GraphData(
-                    nodes=[GraphNode(**node) for node in nodes],
-                    links=[GraphLink(**link) for link in links]
-                )
+                async for record in rel_result:
+                    links.append(GraphLink(
+                        source=record["source"],
+                        target=record["target"],
+                        type=record["type"] or "RELATED_TO",
+                        properties=record["properties"] or {}
+                    ))
+                
+                graph_data = GraphData(nodes=nodes, links=links)
                 
                 return {
                     "success": True,
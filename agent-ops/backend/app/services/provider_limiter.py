@@ -0,0 +1,45 @@
+"""
+Per-provider throttling for AI completions, so many AI nodes running at once
+queue for a bounded number of connections instead of tripping provider rate limits
+"""
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+
+class ProviderLimiter:
+    """
+    Caps concurrent calls to one provider and paces them with a token bucket.
+    Bursts of up to max_concurrency requests go straight through; beyond that
+    requests are released at rate_limit_rpm.
+    """
+
+    def __init__(self, max_concurrency: int = 10, rate_limit_rpm: int = 500):
+        self.max_concurrency = max_concurrency
+        self.rate_limit_rpm = rate_limit_rpm
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._lock = asyncio.Lock()
+        self._rate = rate_limit_rpm / 60.0  # tokens per second
+        self._capacity = float(max_concurrency)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+
+    async def _take_token(self) -> None:
+        """Wait until the bucket has a token, then take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one of the provider's call slots for the duration of a request"""
+        async with self._semaphore:
+            await self._take_token()
+            yield
@@ -3,7 +3,7 @@ Workflow execution service - the core engine for executing workflows
 """
 import uuid
 import asyncio
-from typing import Dict, List, Any, Set, Optional
+from typing import Dict, List, Any, Set, Optional, Sequence
 from datetime import datetime
 import time
 
@@ -34,7 +34,7 @@ class WorkflowExecutionService:
     async def execute_workflow(self, request: WorkflowExecutionRequest) -> WorkflowExecutionResult:
         """Execute a complete workflow"""
         execution_id = str(uuid.uuid4())
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         
         # Track workflow execution in network monitoring
         workflow_operation = NetworkOperation(
@@ -79,6 +79,11 @@ class WorkflowExecutionService:
             execution_order = self._topological_sort(request.workflow.nodes, request.workflow.edges)
             context.log(LogLevel.INFO, f"Execution order: {[node.id for node in execution_order]}")
             
+            # Map each node to its input sources once, rather than scanning every edge per node
+            predecessors: Dict[str, List[str]] = {}
+            for edge in request.workflow.edges:
+                predecessors.setdefault(edge.target, []).append(edge.source)
+            
             # Execute nodes in order
             node_results = []
             total_nodes = len(execution_order)
@@ -92,7 +97,7 @@ class WorkflowExecutionService:
                 context.log(LogLevel.INFO, f"Executing node {i+1}/{total_nodes}: {node.id} ({node.type})")
                 
                 # Get input data from predecessor nodes
-                input_data = self._get_node_input_data(node, request.workflow.edges, context, request.input_data)
+                input_data = self._get_node_input_data(node, predecessors.get(node.id, ()), context, request.input_data)
                 
                 # Track node execution
                 node_operation = NetworkOperation(
@@ -139,7 +144,7 @@ class WorkflowExecutionService:
                     final_output = successful_results[0].output_data
             
             # Calculate total execution time
-            total_time_ms = (time.time() - start_time) * 1000
+            total_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
             
             # Create result
             result = WorkflowExecutionResult(
@@ -206,7 +211,7 @@ class WorkflowExecutionService:
                 workflow_id=request.workflow.id,
                 status=ExecutionStatus.FAILED,
                 completed_at=datetime.now(),
-                total_execution_time_ms=(time.time() - start_time) * 1000,
+                total_execution_time_ms=(time.perf_counter_ns() - start_ns) / 1_000_000,
                 node_results=[],
                 logs=context.logs,
                 errors=[error_msg]
@@ -231,18 +236,15 @@ class WorkflowExecutionService:
             return errors
         
         # Check for duplicate node IDs
-        node_ids = [node.id for node in workflow.nodes]
-        if len(node_ids) != len(set(node_ids)):
+        node_ids = frozenset(node.id for node in workflow.nodes)
+        if len(node_ids) != len(workflow.nodes):
             errors.append("Duplicate node IDs found")
         
         # Check edge references
         for edge in workflow.edges:
-            source_exists = any(node.id == edge.source for node in workflow.nodes)
-            target_exists = any(node.id == edge.target for node in workflow.nodes)
-            
-            if not source_exists:
+            if edge.source not in node_ids:
                 errors.append(f"Edge references non-existent source node: {edge.source}")
-            if not target_exists:
+            if edge.target not in node_ids:
                 errors.append(f"Edge references non-existent target node: {edge.target}")
         
         # Check for cycles (would cause infinite loop)
@@ -276,58 +278,74 @@ class WorkflowExecutionService:
         """Validate GraphRAG nodes have proper database connections and schemas"""
         errors = []
         
-        from .neo4j_service import neo4j_service
+        graphrag_nodes = [node for node in workflow.nodes if node.type == "graphrag"]
+        if not graphrag_nodes:
+            return errors
         
-        for node in workflow.nodes:
-            if node.type == "graphrag":
-                try:
-                    # Check if node has a database connection
-                    has_connection = node.id in neo4j_service.drivers
-                    
-                    if not has_connection:
-                        errors.append(f"GraphRAG node '{node.id}' is not connected to a database. Please connect it in the Schemas tab.")
-                        continue
-                    
-                    # Test the connection
-                    driver_info = neo4j_service.drivers.get(node.id)
-                    if driver_info and driver_info.get("driver"):
-                        driver = driver_info["driver"]
-                        # Configure session with database if it's AuraDB
-                        session_config = {}
-                        if driver_info.get("is_aura") and driver_info.get("database"):
-                            session_config["database"] = driver_info["database"]
-                        
-                        try:
-                            async with driver.session(**session_config) as session:
-                                result = await session.run("RETURN 1 as test")
-                                await result.consume()
-                        except Exception as e:
-                            errors.append(f"GraphRAG node '{node.id}' database connection is not working: {str(e)}")
-                            continue
-                    
-                    # Check if schema is applied (optional warning, not error)
-                    try:
-                        async with driver.session(**session_config) as session:
-                            result = await session.run(
-                                "MATCH (s:SchemaMetadata {node_id: $node_id}) RETURN s.schema as schema",
-                                node_id=node.id
-                            )
-                            record = await result.single()
-                            
-                            if not record or not record["schema"]:
-                                context.log(LogLevel.WARNING, 
-                                    f"GraphRAG node '{node.id}' does not have a schema applied. " +
-                                    "The node will work but extraction may not be guided by schema.", 
-                                    node.id)
-                    except Exception:
-                        # Schema check failed, but this is not critical
-                        pass
-                    
-                except Exception as e:
-                    errors.append(f"GraphRAG node '{node.id}' validation failed: {str(e)}")
+        # Each node talks to its own database, so check them concurrently (bounded)
+        semaphore = asyncio.Semaphore(8)
+        
+        async def bounded(node: WorkflowNode) -> Optional[str]:
+            async with semaphore:
+                return await self._validate_graphrag_node(node, context)
+        
+        results = await asyncio.gather(*(bounded(node) for node in graphrag_nodes), return_exceptions=True)
+        
+        # Report in workflow order
+        for node, result in zip(graphrag_nodes, results):
+            if isinstance(result, Exception):
+                errors.append(f"GraphRAG node '{node.id}' validation failed: {str(result)}")
+            elif result:
+                errors.append(result)
         
         return errors
     
+    async def _validate_graphrag_node(self, node: WorkflowNode, context: ExecutionContext) -> Optional[str]:
+        """Check one GraphRAG node's database connection and schema, returning an error message if invalid"""
+        from .neo4j_service import neo4j_service
+        
+        # Check if node has a database connection
+        driver_info = neo4j_service.drivers.get(node.id)
+        if driver_info is None:
+            return f"GraphRAG node '{node.id}' is not connected to a database. Please connect it in the Schemas tab."
+        
+        driver = driver_info.get("driver")
+        if not driver:
+            return None
+        
+        # Configure session with database if it's AuraDB
+        session_config = {}
+        if driver_info.get("is_aura") and driver_info.get("database"):
+            session_config["database"] = driver_info["database"]
+        
+        # Test the connection
+        try:
+            async with driver.session(**session_config) as session:
+                result = await session.run("RETURN 1 as test")
+                await result.consume()
+        except Exception as e:
+            return f"GraphRAG node '{node.id}' database connection is not working: {str(e)}"
+        
+        # Check if schema is applied (optional warning, not error)
+        try:
+            async with driver.session(**session_config) as session:
+                result = await session.run(
+                    "MATCH (s:SchemaMetadata {node_id: $node_id}) RETURN s.schema as schema",
+                    node_id=node.id
+                )
+                record = await result.single()
+                
+                if not record or not record["schema"]:
+                    context.log(LogLevel.WARNING, 
+                        f"GraphRAG node '{node.id}' does not have a schema applied. " +
+                        "The node will work but extraction may not be guided by schema.", 
+                        node.id)
+        except Exception:
+            # Schema check failed, but this is not critical
+            pass
+        
+        return None
+    
     def _topological_sort(self, nodes: List[WorkflowNode], edges: List[WorkflowEdge]) -> List[WorkflowNode]:
         """Sort nodes in topological order for execution"""
         
@@ -398,30 +416,26 @@ class WorkflowExecutionService:
         
         return False
     
-    def _get_node_input_data(self, node: WorkflowNode, edges: List[WorkflowEdge], context: ExecutionContext, initial_input: Any = None) -> Any:
-        """Get input data for a node from its predecessors"""
-        
-        # Find all edges that target this node
-        input_edges = [edge for edge in edges if edge.target == node.id]
+    def _get_node_input_data(self, node: WorkflowNode, sources: Sequence[str], context: ExecutionContext, initial_input: Any = None) -> Any:
+        """Get input data for a node from its predecessors (the source ids of its input edges)"""
         
-        if not input_edges:
+        if not sources:
             # No input edges - node is a starting node
             context.log(LogLevel.DEBUG, f"Node {node.id} has no input connections, using initial input", node.id)
             return initial_input
         
-        if len(input_edges) == 1:
+        if len(sources) == 1:
             # Single input - return the output directly
-            source_id = input_edges[0].source
+            source_id = sources[0]
             output = context.get_node_output(source_id)
             context.log(LogLevel.DEBUG, f"Node {node.id} receiving input from {source_id}", node.id)
             return output
         
         # Multiple inputs - combine them
-        context.log(LogLevel.DEBUG, f"Node {node.id} receiving input from {len(input_edges)} sources", node.id)
+        context.log(LogLevel.DEBUG, f"Node {node.id} receiving input from {len(sources)} sources", node.id)
         inputs = {}
-        for edge in input_edges:
-            source_output = context.get_node_output(edge.source)
-            inputs[edge.source] = source_output
+        for source_id in sources:
+            inputs[source_id] = context.get_node_output(source_id)
         
         return inputs
     
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Tests for AI completion caching, request coalescing and provider throttling
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.models import ApiProviderType, CompletionRequest, CompletionResponse, TokenCost, TokenUsage
+from app.services.ai_service import AIService
+from app.services.llm_cache import LLMCache, llm_cache
+from app.services.provider_limiter import ProviderLimiter
+
+
+def make_request(temperature=0.0, stream=False, prompt="Summarize the market"):
+    return CompletionRequest(
+        model="llama3-70b-8192",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=temperature,
+        max_tokens=50,
+        stream=stream
+    )
+
+
+def make_response(content="ok"):
+    return CompletionResponse(
+        provider=ApiProviderType.GROQ,
+        model="llama3-70b-8192",
+        content=content,
+        usage=TokenUsage(prompt_tokens=10, completion_tokens=5, total_tokens=15),
+        cost=TokenCost(prompt_cost=0.1, completion_cost=0.2, total_cost=0.3),
+        latency_ms=120.0,
+        request_id="req-1"
+    )
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """AIService whose provider calls are counted instead of sent"""
+    llm_cache.clear()
+    service = AIService()
+    service.calls = 0
+
+    async def fake_get_completion(provider, request):
+        service.calls += 1
+        call = service.calls
+        await asyncio.sleep(0.01)
+        return make_response(f"sample {call}")
+
+    monkeypatch.setattr(service, "_get_completion", fake_get_completion)
+    yield service
+    llm_cache.clear()
+
+
+def test_only_deterministic_requests_are_cacheable():
+    assert LLMCache.is_cacheable(make_request(temperature=0.0))
+    assert not LLMCache.is_cacheable(make_request(temperature=0.7))
+    assert not LLMCache.is_cacheable(make_request(temperature=0.0, stream=True))
+
+
+def test_cache_hit_reports_no_usage():
+    cache = LLMCache()
+    request = make_request()
+    assert cache.get(ApiProviderType.GROQ, request) is None
+
+    cache.set(ApiProviderType.GROQ, request, make_response())
+    hit = cache.get(ApiProviderType.GROQ, request)
+    assert hit.content == "ok"
+    assert hit.cache_hit
+    assert hit.usage.total_tokens == 0
+    assert hit.cost.total_cost == 0.0
+    assert hit.latency_ms == 0.0
+
+    # Other providers and prompts are separate entries
+    assert cache.get(ApiProviderType.OPENAI, request) is None
+    assert cache.get(ApiProviderType.GROQ, make_request(prompt="Something else")) is None
+
+
+@pytest.mark.asyncio
+async def test_identical_deterministic_requests_share_one_call(service):
+    responses = await asyncio.gather(*(service.get_completion(ApiProviderType.GROQ, make_request()) for _ in range(3)))
+    assert service.calls == 1
+    assert {response.content for response in responses} == {"sample 1"}
+    # Each caller gets its own copy
+    assert len({id(response) for response in responses}) == 3
+
+    # Later identical requests are answered from llm_cache
+    response = await service.get_completion(ApiProviderType.GROQ, make_request())
+    assert service.calls == 1
+    assert response.cache_hit
+
+
+@pytest.mark.asyncio
+async def test_sampled_requests_are_never_shared(service):
+    request = make_request(temperature=0.7)
+    responses = await asyncio.gather(*(service.get_completion(ApiProviderType.GROQ, request) for _ in range(3)))
+    assert service.calls == 3
+    assert len({response.content for response in responses}) == 3
+
+    await service.get_completion(ApiProviderType.GROQ, request)
+    assert service.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_provider_limiter_caps_concurrency():
+    limiter = ProviderLimiter(max_concurrency=2, rate_limit_rpm=60_000)
+    active = 0
+    peak = 0
+
+    async def call():
+        nonlocal active, peak
+        async with limiter.slot():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    await asyncio.gather(*(call() for _ in range(6)))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_limiter_paces_requests_past_the_burst():
+    # A burst of max_concurrency goes straight through, then 10 requests per second
+    limiter = ProviderLimiter(max_concurrency=2, rate_limit_rpm=600)
+
+    start = time.monotonic()
+    for _ in range(2):
+        async with limiter.slot():
+            pass
+    assert time.monotonic() - start < 0.05
+
+    async with limiter.slot():
+        pass
+    assert time.monotonic() - start >= 0.09
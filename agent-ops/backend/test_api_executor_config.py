@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Tests for API node configuration parsing
+"""
+import pytest
+
+from app.services.execution.executors.api_executor import APIExecutor
+
+
+@pytest.mark.parametrize("field", ["headers", "params"])
+def test_null_headers_and_params_are_accepted(field):
+    config = {'url': 'https://example.com', 'method': 'get', field: None}
+    assert APIExecutor().validate_config(config)
+
+
+def test_invalid_configs_are_rejected():
+    executor = APIExecutor()
+    assert not executor.validate_config({'method': 'GET'})
+    assert not executor.validate_config({'url': 'https://example.com', 'method': 'TRACE'})
+    assert not executor.validate_config({'url': 'https://example.com', 'timeout': 0})
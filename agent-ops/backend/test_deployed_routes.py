@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Tests for deployed node status caching and memoized node execution
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services.dynamic_route_service import DynamicRouteService
+from app.models.workflow_models import WorkflowNode, NodeType
+
+
+def deploy(nodes, deployment_id='routes-test'):
+    app = FastAPI()
+    service = DynamicRouteService(app)
+    service.generate_routes_from_workflow(nodes, [], deployment_id)
+    return service, TestClient(app)
+
+
+def make_node(node_id, node_type, config):
+    return WorkflowNode(
+        id=node_id,
+        type=node_type,
+        position={'x': 0, 'y': 0},
+        data={'label': node_id},
+        config=config
+    )
+
+
+def test_status_route_revalidates_with_etag():
+    _, client = deploy([make_node('doc-status', NodeType.DOCUMENT, {'chunk_size': 100})])
+
+    response = client.get('/nodes/doc-status/status')
+    assert response.status_code == 200
+    assert response.json()['config'] == {'chunk_size': 100}
+    assert response.headers['cache-control'] == 'no-cache'
+    etag = response.headers['etag']
+
+    # Same representation: 304 with no body
+    response = client.get('/nodes/doc-status/status', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers['etag'] == etag
+
+    # Served under the deployment prefix too, with the same ETag
+    response = client.get('/api/deployed/routes-test/nodes/doc-status/status', headers={'If-None-Match': etag})
+    assert response.status_code == 304
+
+    response = client.get('/nodes/doc-status/status', headers={'If-None-Match': '"stale"'})
+    assert response.status_code == 200
+
+
+def test_status_etag_changes_when_default_config_is_applied():
+    service, client = deploy([make_node('chat-status', NodeType.CHATBOT, {})], 'status-test')
+    response = client.get('/nodes/chat-status/status')
+    assert response.json()['config'] == {}
+    etag = response.headers['etag']
+
+    # Nodes without a config get their type's defaults on first execution
+    client.post('/api/deployed/status-test/execute', json={'input_data': 'hello'})
+
+    response = client.get('/nodes/chat-status/status', headers={'If-None-Match': etag})
+    assert response.status_code == 200
+    assert response.json()['config'] == service.get_ai_node_config('chatbot')
+    assert response.headers['etag'] != etag
+
+
+def test_deterministic_nodes_are_memoized():
+    service, client = deploy([make_node('doc-memo', NodeType.DOCUMENT, {'chunk_size': 20})], 'memo-test')
+
+    def run():
+        response = client.post('/api/deployed/memo-test/execute', json={'input_data': 'alpha beta gamma delta'})
+        assert response.status_code == 200
+        return response.json()['final_output']
+
+    first = run()
+    assert first['status'] == 'completed'
+    assert first['logs']
+
+    second = run()
+    # Same output, but no timing or logs carried over from the first run
+    assert second['output_data'] == first['output_data']
+    assert second['execution_time_ms'] == 0.0
+    assert second['logs'] == []
+
+    # After clearing the cache the node runs again
+    assert service.clear_execution_cache() == 1
+    assert run()['logs']
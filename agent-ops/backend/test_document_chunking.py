@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Tests for document chunking and batch processing
+"""
+import random
+
+import pytest
+
+from app.services.execution.executors.document_executor import DocumentExecutor, _process_text
+from app.services.execution.base_executor import ExecutionContext
+from app.models.workflow_models import WorkflowNode, NodeType
+
+WORDS = ["a", "market", "link", "of", "cultural", "exchange", "x" * 30, "data"]
+
+
+def reference_chunks(text, chunk_size):
+    """The original word-list chunker"""
+    chunks = []
+    current_chunk = []
+    current_size = 0
+    for word in text.split():
+        word_size = len(word) + 1  # +1 for space
+        if current_size + word_size > chunk_size and current_chunk:
+            chunks.append(" ".join(current_chunk))
+            current_chunk = [word]
+            current_size = word_size
+        else:
+            current_chunk.append(word)
+            current_size += word_size
+    if current_chunk:
+        chunks.append(" ".join(current_chunk))
+    return chunks
+
+
+def random_text(rng, separators):
+    return "".join(rng.choice(WORDS) + rng.choice(separators) for _ in range(rng.randint(0, 80)))
+
+
+def test_chunks_match_reference_on_single_spaced_text():
+    rng = random.Random(7)
+    for _ in range(500):
+        text = random_text(rng, [" "]).rstrip()
+        chunk_size = rng.randint(1, 120)
+        assert DocumentExecutor._chunk_text(text, chunk_size) == reference_chunks(text, chunk_size), (text, chunk_size)
+
+
+def test_chunks_keep_document_whitespace():
+    rng = random.Random(8)
+    for _ in range(500):
+        text = random_text(rng, [" ", "  ", "\n", "\n\n", "\t"])
+        chunk_size = rng.randint(1, 120)
+        chunks = DocumentExecutor._chunk_text(text, chunk_size)
+        # Same words in the same order, every chunk a slice of the document
+        assert [word for chunk in chunks for word in chunk.split()] == text.split()
+        assert all(chunk in text for chunk in chunks)
+        # Within chunk_size (with a trailing separator) unless a single long word
+        assert all(len(chunk) + 1 <= chunk_size or len(chunk.split()) == 1 for chunk in chunks)
+
+
+def test_document_counts_match_reference():
+    rng = random.Random(9)
+    for _ in range(200):
+        text = random_text(rng, [" ", "\n", "\n\n", " \n\n "])
+        word_count, paragraph_count, _, _ = _process_text(text, 100, False)
+        assert word_count == len(text.split())
+        assert paragraph_count == len([p for p in text.split('\n\n') if p.strip()])
+
+
+@pytest.mark.asyncio
+async def test_batch_texts_match_single_document_results():
+    texts = ["Alice met Bob in Paris. Alice emailed bob@example.com.", "market link " * 40]
+    executor = DocumentExecutor()
+    node = WorkflowNode(
+        id='doc-batch',
+        type=NodeType.DOCUMENT,
+        position={'x': 0, 'y': 0},
+        data={'label': 'Batch'},
+        config={'batch_texts': texts, 'chunk_size': 60, 'extract_entities': True}
+    )
+
+    result = await executor.execute(node, ExecutionContext('test-batch'), None)
+    assert result.error_message is None
+    documents = result.output_data['documents']
+    assert len(documents) == 2
+
+    for text, document in zip(texts, documents):
+        single = WorkflowNode(
+            id='doc-single',
+            type=NodeType.DOCUMENT,
+            position={'x': 0, 'y': 0},
+            data={'label': 'Single'},
+            config={'chunk_size': 60, 'extract_entities': True}
+        )
+        expected = await executor.execute(single, ExecutionContext('test-single'), text)
+        assert document == expected.output_data
+
+    assert result.output_data['metadata']['chunk_count'] == sum(len(d['chunks']) for d in documents)
+
+
+@pytest.mark.asyncio
+async def test_chunk_batch_in_worker_processes_matches_inline():
+    texts = ["word " * 50_000, "other words " * 20_000]
+    pooled = await DocumentExecutor().chunk_batch(texts, 200)
+    assert pooled == [_process_text(text, 200, False) for text in texts]
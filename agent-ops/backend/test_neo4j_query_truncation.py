@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Tests for max_records truncation reporting in Neo4j queries
+"""
+import pytest
+
+from app.services.neo4j_service import neo4j_service
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for row in self.rows:
+            yield row
+
+
+class FakeSession:
+    def __init__(self, rows):
+        self.rows = rows
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def run(self, query, parameters):
+        return FakeResult(self.rows)
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    """Make every session return these rows"""
+    rows = []
+    monkeypatch.setattr(neo4j_service, "get_session", lambda node_id: FakeSession(rows))
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_truncated_only_when_rows_were_dropped(rows):
+    rows.extend({"n": i} for i in range(5))
+
+    response = await neo4j_service.execute_query("graph", "MATCH (n) RETURN n", max_records=3)
+    assert response.success
+    assert response.data == [{"n": 0}, {"n": 1}, {"n": 2}]
+    assert response.truncated
+    assert "truncated to 3 records" in response.message
+
+    # Exactly max_records rows: nothing was dropped
+    response = await neo4j_service.execute_query("graph", "MATCH (n) RETURN n", max_records=5)
+    assert len(response.data) == 5
+    assert not response.truncated
+
+    response = await neo4j_service.execute_query("graph", "MATCH (n) RETURN n")
+    assert len(response.data) == 5
+    assert not response.truncated
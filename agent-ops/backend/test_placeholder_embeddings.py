@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Tests for placeholder embeddings results
+"""
+import json
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.services.execution.executors.placeholder_executor import PlaceholderExecutor
+from app.services.execution.base_executor import ExecutionContext
+from app.models.workflow_models import WorkflowNode, WorkflowExecutionResult, ExecutionStatus
+
+
+async def run_embeddings(config):
+    node = WorkflowNode(
+        id='embed-1',
+        type='embeddings',
+        position={'x': 0, 'y': 0},
+        data={'label': 'Embeddings'},
+        config=config
+    )
+    return await PlaceholderExecutor('embeddings').execute(node, ExecutionContext('test-embeddings'), 'some text')
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("config", [{}, {"return_numpy": True}])
+async def test_embeddings_result_serializes_through_response_model(config):
+    if config:
+        pytest.importorskip("numpy")
+    node_result = await run_embeddings(config)
+    assert node_result.status == ExecutionStatus.COMPLETED.value
+
+    # /api/workflow/execute returns a WorkflowExecutionResult
+    workflow_result = WorkflowExecutionResult(
+        execution_id='test-embeddings',
+        status=ExecutionStatus.COMPLETED,
+        node_results=[node_result],
+        final_output=node_result.output_data
+    )
+    payload = json.loads(workflow_result.model_dump_json())
+    assert jsonable_encoder(workflow_result)['final_output'] == payload['final_output']
+
+    embeddings = payload['final_output']['embeddings']
+    assert len(embeddings) == 1536
+    assert embeddings[0] == pytest.approx(0.1)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Tests for Search Node document search modes
+"""
+import random
+
+import pytest
+
+from app.services.execution.executor_factory import ExecutorFactory
+from app.services.execution.executors import search_executor
+from app.models.workflow_models import WorkflowNode, NodeType
+from app.services.execution.base_executor import ExecutionContext
+
+TEXT = "The Market Link connects market data to every link."
+
+
+def make_search_node(query, match_terms=None):
+    config = {'search_type': 'document', 'query': query}
+    if match_terms is not None:
+        config['match_terms'] = match_terms
+    return WorkflowNode(
+        id='search-test',
+        type=NodeType.SEARCH,
+        position={'x': 0, 'y': 0},
+        data={'label': 'Document Search'},
+        config=config
+    )
+
+
+def brute_force_count(text, terms):
+    """Count every (possibly overlapping) occurrence of each distinct term"""
+    text = text.lower()
+    return sum(
+        sum(1 for i in range(len(text)) if text.startswith(term, i))
+        for term in {t.lower() for t in terms}
+    )
+
+
+async def search(query, text, match_terms=None):
+    executor = ExecutorFactory.get_executor(NodeType.SEARCH)
+    result = await executor.execute(make_search_node(query, match_terms), ExecutionContext('test-search'), text)
+    assert result.error_message is None
+    return result.output_data
+
+
+@pytest.fixture(params=["automaton", "find loops"])
+def match_mode(request, monkeypatch):
+    """Run a test with the Aho-Corasick automaton and with the per-term find loops it falls back to"""
+    if request.param == "automaton":
+        if search_executor.ahocorasick is None:
+            pytest.skip("pyahocorasick is not installed")
+    else:
+        monkeypatch.setattr(search_executor, "ahocorasick", None)
+    return request.param
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("match_terms", [None, False])
+async def test_phrase_search_matches_whole_query_only(match_terms):
+    # Phrase matching is the default
+    output = await search("market link", TEXT, match_terms)
+    result = output['results'][0]
+    assert result['matches_count'] == 1
+    assert result['matches'][0]['highlighted'].count("**Market Link**") == 1
+
+    output = await search("link market", TEXT, match_terms)
+    assert output['total_results'] == 0
+
+
+@pytest.mark.asyncio
+async def test_terms_are_matched_separately_when_enabled(match_mode):
+    output = await search("market link", TEXT, match_terms=True)
+    result = output['results'][0]
+    assert result['matches_count'] == 4
+    # Context is only kept for the first 3 matches, in document order
+    assert [m['position'] for m in result['matches']] == [4, 11, 25]
+
+    # A repeated term is one term, counted once per occurrence
+    output = await search("b b", "cba b b", match_terms=True)
+    assert output['results'][0]['matches_count'] == 3
+
+
+@pytest.mark.asyncio
+async def test_per_term_counts_match_brute_force(match_mode):
+    rng = random.Random(11)
+    for _ in range(300):
+        text = "".join(rng.choice("abcAB ") for _ in range(rng.randint(0, 60)))
+        terms = [rng.choice(["a", "b", "ab", "ba", "B", "abc", "aa", "c"]) for _ in range(rng.randint(1, 4))]
+        output = await search(" ".join(terms), text, match_terms=True)
+        actual = output['results'][0]['matches_count'] if output['results'] else 0
+        assert actual == brute_force_count(text, terms), (text, terms)
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for the deployed workflow scheduler's fan-in ordering
+"""
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.services.dynamic_route_service import DynamicRouteService
+from app.models.workflow_models import WorkflowNode, NodeType
+
+
+def deploy(node_ids, edges, deployment_id='dag-test'):
+    """Deploy logical connector nodes wired by edges, returning a client for the app"""
+    app = FastAPI()
+    nodes = [
+        WorkflowNode(
+            id=node_id,
+            type=NodeType.LOGICAL_CONNECTOR,
+            position={'x': 0, 'y': 0},
+            data={'label': node_id},
+            config={'operation': 'and'}
+        )
+        for node_id in node_ids
+    ]
+    DynamicRouteService(app).generate_routes_from_workflow(nodes, edges, deployment_id)
+    return TestClient(app)
+
+
+def execute(client, deployment_id='dag-test'):
+    response = client.post(f'/api/deployed/{deployment_id}/execute', json={'input_data': True})
+    assert response.status_code == 200
+    body = response.json()
+    assert body['success']
+    return body
+
+
+def test_fan_out_fan_in_completes_in_launch_order():
+    branches = ['l1', 'l2', 'l3', 'l4']
+    edges = [{'source': 'doc', 'target': b} for b in branches] + [{'source': b, 'target': 'join'} for b in branches]
+    client = deploy(['doc', *branches, 'join'], edges)
+
+    orders = set()
+    for _ in range(20):
+        body = execute(client)
+        orders.add(tuple(body['execution_order']))
+    assert orders == {('doc', *branches, 'join')}
+
+    # The join node gets its dependencies' outputs in dependency order
+    join_inputs = body['node_outputs']['join']['output_data']['inputs'][0]
+    assert list(join_inputs) == branches
+
+
+def test_diamond_with_extra_start_node():
+    edges = [
+        {'source': 'a', 'target': 'b'},
+        {'source': 'a', 'target': 'c'},
+        {'source': 'b', 'target': 'd'},
+        {'source': 'c', 'target': 'd'},
+        {'source': 'e', 'target': 'd'},
+    ]
+    client = deploy(['a', 'b', 'c', 'd', 'e'], edges)
+
+    orders = set()
+    for _ in range(20):
+        body = execute(client)
+        orders.add(tuple(body['execution_order']))
+    assert orders == {('a', 'e', 'b', 'c', 'd')}
+
+    # The fan-in node ran once, with all three inputs
+    assert body['execution_order'].count('d') == 1
+    assert sorted(body['node_outputs']['d']['output_data']['inputs'][0]) == ['b', 'c', 'e']
+
+
+def test_edges_to_unknown_nodes_are_ignored():
+    edges = [{'source': 'a', 'target': 'ghost'}, {'source': 'phantom', 'target': 'b'}, {'source': 'a', 'target': 'b'}]
+    client = deploy(['a', 'b'], edges)
+
+    body = execute(client)
+    assert body['execution_order'] == ['a', 'b']
@@ -367,7 +367,7 @@ const DeploymentModal: React.FC<DeploymentModalProps> = ({
           console.log(`🚀 Starting execution of node: ${update.node_id}`);
           setCurrentExecutingNode(update.node_id);
         } else if (update.type === 'node_complete') {
-          console.log(`✅ Completed execution of node: ${update.node_id}`, update.result);
+          console.log(`✅ Completed execution of node: ${update.node_id}`, update.output_preview);
           setCurrentExecutingNode(null);
         } else if (update.type === 'error') {
           console.error(`❌ Error in node ${update.node_id}:`, update.error);
@@ -248,6 +248,8 @@ export class DeploymentService {
 
       const decoder = new TextDecoder();
       let finalResult: WorkflowExecutionResponse | null = null;
+      // Node outputs arrive one event per node rather than in workflow_complete
+      const nodeOutputs: Record<string, any> = {};
 
       while (true) {
         const { done, value } = await reader.read();
@@ -266,6 +268,10 @@ export class DeploymentService {
               // Call progress callback
               onProgress(update);
               
+              if (update.type === 'node_output') {
+                nodeOutputs[update.node_id] = update.output;
+              }
+
               // Store final result
               if (update.type === 'workflow_complete') {
                 finalResult = {
@@ -275,7 +281,7 @@ export class DeploymentService {
                   nodes_executed: update.nodes_executed,
                   execution_order: update.execution_order,
                   final_output: update.final_output,
-                  node_outputs: update.node_outputs,
+                  node_outputs: nodeOutputs,
                   message: update.message
                 };
               }